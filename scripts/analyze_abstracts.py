@@ -10,46 +10,64 @@ Reads abstracts_20.yaml and produces abstract_analysis.json with:
 
 This replaces LLM estimation with verifiable, reproducible metrics.
 """
-import sys, re, json, yaml, math
+import os, sys, re, json, yaml, math, heapq, statistics
 from pathlib import Path
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import ahocorasick  # optional (pyahocorasick): single-pass hedge matching
+except ImportError:
+    ahocorasick = None
+
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml-backed, same safe subset
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import orjson  # optional: faster JSON output, same layout as json.dump(indent=2)
+except ImportError:
+    orjson = None
 
 
 # ── Verb Extraction ──────────────────────────────────────────────
 
-# Patterns that capture the main-clause verb in academic abstracts
+# Patterns that capture the main-clause verb in academic abstracts.
+# Each alternative stores its verb in a named group so the text is walked once;
+# the group name (m.lastgroup) tells which pattern matched.
 VERB_PATTERNS = [
     # "Here we demonstrate/show/report/introduce/overcome..."
-    r'[Hh]ere\s+we\s+(\w+)',
+    r'[Hh]ere\s+we\s+(?P<hw>\w+)',
     # "We demonstrate/show/achieve..."
-    r'(?<![Hh]ere\s)\bWe\s+(\w+)',
+    r'(?<![Hh]ere\s)\bWe\s+(?P<we>\w+)',
     # "Our approach/method/results + verb"
-    r'(?:Our|This|The)\s+(?:approach|method|results?|work|study|findings?|strategy)\s+(\w+)',
+    r'(?:Our|This|The)\s+(?:approach|method|results?|work|study|findings?|strategy)\s+(?P<subj>\w+)',
     # "...enabling/establishing/opening..."  (gerund in impact clauses)
-    r'(?:thereby|thus|,)\s+(enabling|establishing|opening|revealing|overcoming|introducing|unlocking|harnessing|achieving)\b',
+    r'(?:thereby|thus|,)\s+(?P<ger>enabling|establishing|opening|revealing|overcoming|introducing|unlocking|harnessing|achieving)\b',
 ]
+_VERB_RE = re.compile('|'.join(f'(?:{p})' for p in VERB_PATTERNS))
 
-# Normalize verb forms to base form (lightweight, no spaCy needed)
-VERB_NORMALIZE = {
-    'demonstrates': 'demonstrate', 'demonstrated': 'demonstrate',
-    'shows': 'show', 'showed': 'show', 'shown': 'show',
-    'achieves': 'achieve', 'achieved': 'achieve',
-    'enables': 'enable', 'enabled': 'enable', 'enabling': 'enable',
-    'reveals': 'reveal', 'revealed': 'reveal', 'revealing': 'reveal',
-    'overcomes': 'overcome', 'overcame': 'overcome', 'overcoming': 'overcome',
-    'introduces': 'introduce', 'introduced': 'introduce', 'introducing': 'introduce',
-    'establishes': 'establish', 'established': 'establish', 'establishing': 'establish',
-    'presents': 'present', 'presented': 'present', 'presenting': 'present',
-    'reports': 'report', 'reported': 'report', 'reporting': 'report',
-    'develops': 'develop', 'developed': 'develop', 'developing': 'develop',
-    'provides': 'provide', 'provided': 'provide', 'providing': 'provide',
-    'opens': 'open', 'opened': 'open', 'opening': 'open',
-    'unlocks': 'unlock', 'unlocked': 'unlock', 'unlocking': 'unlock',
-    'harnesses': 'harness', 'harnessed': 'harness', 'harnessing': 'harness',
-    'uses': 'use', 'used': 'use', 'using': 'use',
-    'designs': 'design', 'designed': 'design', 'designing': 'design',
-    'proves': 'prove', 'proved': 'prove', 'proving': 'prove',
-}
+# Normalize verb forms to base form (lightweight, no spaCy needed).
+# Regular -s/-es, -(e)d and -ing forms are generated from the base list, so a new
+# verb is one entry; only irregular past forms are spelled out.
+_VERB_BASES = (
+    'demonstrate', 'show', 'achieve', 'enable', 'reveal', 'overcome',
+    'introduce', 'establish', 'present', 'report', 'develop', 'provide',
+    'open', 'unlock', 'harness', 'use', 'design', 'prove',
+)
+_IRREGULAR_PAST = {'show': ('showed', 'shown'), 'overcome': ('overcame',)}
+
+
+def _inflections(base):
+    """Third-person, past and gerund forms of a regular verb."""
+    stem = base[:-1] if base.endswith('e') else base
+    yield base + ('es' if base.endswith(('s', 'sh', 'ch', 'x')) else 's')
+    yield from _IRREGULAR_PAST.get(base, (stem + 'ed',))
+    yield stem + 'ing'
+
+
+VERB_NORMALIZE = {form: base for base in _VERB_BASES for form in _inflections(base)}
 
 # Verbs too generic to be useful
 STOP_VERBS = {
@@ -66,68 +84,92 @@ STOP_VERBS = {
 
 
 def extract_verbs(text):
-    """Extract main-clause verbs from abstract text."""
+    """Extract main-clause verbs from abstract text.
+
+    Returns (verbs, here_we_verbs). here_we_verbs holds every normalized verb
+    after "Here we", unfiltered, for the pivot analysis.
+    """
     verbs = []
-    for pattern in VERB_PATTERNS:
-        for match in re.finditer(pattern, text):
-            verb = match.group(1).lower()
-            verb = VERB_NORMALIZE.get(verb, verb)
-            if verb not in STOP_VERBS and len(verb) > 2:
-                verbs.append(verb)
-    return verbs
+    here_we_verbs = []
+    for match in _VERB_RE.finditer(text):
+        verb = match.group(match.lastgroup).lower()
+        verb = VERB_NORMALIZE.get(verb, verb)
+        if match.lastgroup == 'hw':
+            here_we_verbs.append(verb)
+        if verb not in STOP_VERBS and len(verb) > 2:
+            verbs.append(verb)
+    return verbs, here_we_verbs
 
 
 # ── N-gram Extraction ────────────────────────────────────────────
 
-def tokenize(text):
-    """Simple word tokenizer for n-gram analysis."""
-    # Remove numbers with units (keep domain terms)
-    text = text.lower()
-    # Split on non-alpha chars but keep hyphens in compound terms
-    tokens = re.findall(r'[a-z][a-z\-]+[a-z]', text)
-    return tokens
+# Split on non-alpha chars but keep hyphens in compound terms
+_TOKEN_RE = re.compile(r'[a-z][a-z\-]+[a-z]')
+
 
+def tokenize(text_lower):
+    """Simple word tokenizer for n-gram analysis. Expects lowercased text."""
+    # Numbers and units are dropped (keeps domain terms); every token has 3+ chars
+    return _TOKEN_RE.findall(text_lower)
 
-STOPWORDS = {
+
+STOPWORDS = frozenset({
     'the', 'and', 'for', 'that', 'this', 'with', 'from', 'are', 'was',
     'were', 'been', 'being', 'have', 'has', 'had', 'its', 'our', 'their',
     'which', 'these', 'those', 'but', 'not', 'can', 'also', 'such',
     'than', 'into', 'over', 'between', 'through', 'using', 'via',
     'here', 'both', 'well', 'each', 'more', 'most', 'however',
     'yet', 'although', 'while', 'when', 'where', 'how', 'what',
-}
+})
 
 
-def extract_ngrams(text, n=2):
-    """Extract n-grams, filtering stopwords."""
-    tokens = tokenize(text)
-    ngrams = []
-    for i in range(len(tokens) - n + 1):
-        gram = tokens[i:i+n]
-        # Skip if any token is a stopword or too short
-        if any(t in STOPWORDS or len(t) < 3 for t in gram):
-            continue
-        ngrams.append(' '.join(gram))
-    return ngrams
+def extract_ngrams(tokens, n=2):
+    """Yield n-grams from a token list, skipping windows with a stopword."""
+    run = 0  # consecutive non-stopword tokens ending at i
+    for i, t in enumerate(tokens):
+        run = 0 if t in STOPWORDS else run + 1
+        if run >= n:
+            yield ' '.join(tokens[i - n + 1:i + 1])
 
 
 # ── Opening/Closing Classification ──────────────────────────────
 
-def classify_opening(sentence):
-    """Classify the opening sentence pattern."""
-    s = sentence.lower().strip()
-
+# Rules in priority order; the group name is the label with '_' for '-'.
+_OPENING_RULES = [
     # Problem-first: starts with "despite", "although", "the challenge", "the problem"
-    if re.match(r'^(despite|although|the\s+(challenge|problem|limitation|lack|difficulty))', s):
-        return 'problem-first'
-
+    ('problem_first', r'despite|although|the\s+(?:challenge|problem|limitation|lack|difficulty)'),
     # Bold claim: starts with assertive statement about capability
-    if re.match(r'^(the\s+ability|achieving|controlling|harnessing)', s):
-        return 'bold-claim'
-
+    ('bold_claim', r'the\s+ability|achieving|controlling|harnessing'),
     # Function-first: starts with what something does/offers
-    if re.match(r'^\w[\w\s,-]+\s+(offer|provide|enable|allow|permit)', s):
-        return 'function-first'
+    ('function_first', r'\w[\w\s,-]+\s+(?:offer|provide|enable|allow|permit)'),
+]
+
+_CLOSING_RULES = [
+    ('pathway', r'open[s]?\s+(?:a\s+)?pathway|pave[s]?\s+the\s+way|open[s]?\s+.*(?:route|prospect|door|possibilit)'),
+    ('promise', r'promis|potential|exciting|great promise'),
+    ('paradigm', r'establish|paradigm|new\s+platform|framework|make[s]?\s+this'),
+    ('application', r'application|sensing|imaging|device|technolog|commerc|future\s+direction'),
+    ('quantitative_recap', r'\d+-fold|\d+\s*%|factor\s+of'),
+    ('outlook', r'avenue|enable|novel.*science|suitable.*platform|expand.*scope'),
+]
+
+# Opening rules are anchored, so a plain alternation tried at position 0
+# already honours rule order.
+_OPENING_RE = re.compile('|'.join(f'(?P<{name}>{pat})' for name, pat in _OPENING_RULES))
+# Closing rules match anywhere, but the first *rule* must win rather than the
+# leftmost hit: each alternative is a lookahead from the start of the sentence
+# that tags its rule with an empty named group.
+_CLOSING_RE = re.compile('|'.join(
+    fr'(?=[\s\S]*?(?:{pat}))(?P<{name}>)' for name, pat in _CLOSING_RULES
+))
+
+
+def classify_opening(sentence):
+    """Classify the opening sentence pattern."""
+    s = sentence.lower().strip()
+    m = _OPENING_RE.match(s)
+    if m:
+        return m.lastgroup.replace('_', '-')
 
     # Default: object-first (most common - names the object/field)
     return 'object-first'
@@ -136,25 +178,40 @@ def classify_opening(sentence):
 def classify_closing(sentence):
     """Classify the closing sentence pattern."""
     s = sentence.lower().strip()
-
-    if re.search(r'open[s]?\s+(a\s+)?pathway|pave[s]?\s+the\s+way|open[s]?\s+.*(route|prospect|door|possibilit)', s):
-        return 'pathway'
-    if re.search(r'promis|potential|exciting|great promise', s):
-        return 'promise'
-    if re.search(r'establish|paradigm|new\s+platform|framework|make[s]?\s+this', s):
-        return 'paradigm'
-    if re.search(r'application|sensing|imaging|device|technolog|commerc|future\s+direction', s):
-        return 'application'
-    if re.search(r'\d+-fold|\d+\s*%|factor\s+of', s):
-        return 'quantitative-recap'
-    if re.search(r'avenue|enable|novel.*science|suitable.*platform|expand.*scope', s):
-        return 'outlook'
+    m = _CLOSING_RE.match(s)
+    if m:
+        return m.lastgroup.replace('_', '-')
 
     return 'other'
 
 
 # ── Topic Alignment ──────────────────────────────────────────────
 
+def _keyword_counts(needles, lowered_texts):
+    """{needle: [text.count(needle) for text in lowered_texts]}.
+
+    With pyahocorasick every text is scanned once for all needles instead of
+    once per needle; hits of one needle are kept non-overlapping, as in
+    str.count.
+    """
+    needles = set(needles)
+    if ahocorasick is None or not needles or '' in needles:
+        return {kw: [t.count(kw) for t in lowered_texts] for kw in needles}
+    automaton = ahocorasick.Automaton()
+    for kw in needles:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    counts = {kw: [0] * len(lowered_texts) for kw in needles}
+    for i, text in enumerate(lowered_texts):
+        last_end = {}
+        for end, kw in automaton.iter(text):
+            start = end + 1 - len(kw)
+            if start >= last_end.get(kw, 0):
+                counts[kw][i] += 1
+                last_end[kw] = end + 1
+    return counts
+
+
 def compute_topic_alignment(manuscript_keywords, abstract_texts):
     """Compute keyword overlap score between manuscript and abstract corpus.
 
@@ -166,17 +223,31 @@ def compute_topic_alignment(manuscript_keywords, abstract_texts):
     if n_docs == 0:
         return 0.0, {}
 
-    # Count document frequency for each manuscript keyword
+    # Lowercase each abstract once, not once per keyword
+    lowered_texts = [text.lower() for text in abstract_texts]
+
+    # Per-abstract mention counts: a non-zero count means the abstract
+    # contains the keyword, so doc frequency and total mentions share it.
+    # Matching is deliberately substring-based rather than token-set lookup:
+    # extracted keywords are often compound fragments ('Near' from
+    # 'Near-field') and plurals ('method' in 'methods') must still count.
+    kw_counts = _keyword_counts((kw.lower() for kw in manuscript_keywords), lowered_texts)
+    freqs = {}
+    for kw in manuscript_keywords:
+        counts = kw_counts[kw.lower()]
+        freqs[kw] = (sum(1 for c in counts if c), sum(counts))
+
+    # IDF: log(N / (1 + df)) — rare matches score higher
+    idf_table = {
+        kw: math.log(n_docs / (1 + doc_freq)) if doc_freq > 0 else 0
+        for kw, (doc_freq, _) in freqs.items()
+    }
+
     keyword_scores = {}
     for kw in manuscript_keywords:
-        kw_lower = kw.lower()
-        # Count how many abstracts contain this keyword
-        doc_freq = sum(1 for text in abstract_texts if kw_lower in text.lower())
+        doc_freq, total_freq = freqs[kw]
         # TF component: raw count across all abstracts
-        total_freq = sum(text.lower().count(kw_lower) for text in abstract_texts)
-        # IDF: log(N / (1 + df)) — rare matches score higher
-        idf = math.log(n_docs / (1 + doc_freq)) if doc_freq > 0 else 0
-        tf_idf = total_freq * idf if doc_freq > 0 else 0
+        tf_idf = total_freq * idf_table[kw]
 
         keyword_scores[kw] = {
             'doc_frequency': doc_freq,
@@ -221,26 +292,94 @@ HEDGE_LEXICON = {
     ],
 }
 
+_HEDGE_RES = {
+    category: [re.compile(p) for p in patterns]
+    for category, patterns in HEDGE_LEXICON.items()
+}
+
+# A lexicon entry that is a plain phrase, optionally wrapped in \b
+_LITERAL_HEDGE_RE = re.compile(r'(\\b)?([\w ~]+?)(\\b)?')
 
-def detect_hedges(text):
-    """Detect hedging expressions in text. Returns per-category counts and total."""
+
+def _build_hedge_automaton():
+    """Load every plain-phrase hedge pattern into one Aho-Corasick automaton.
+
+    Returns (automaton, literal_keys); literal_keys holds the (category, index)
+    of patterns the automaton answers for. The rest ('can(?!not)', 'opening.*?',
+    inflection groups) stay on their compiled regexes.
+    """
+    if ahocorasick is None:
+        return None, frozenset()
+    automaton = ahocorasick.Automaton()
+    literal_keys = set()
+    for category, patterns in HEDGE_LEXICON.items():
+        for i, pat in enumerate(patterns):
+            m = _LITERAL_HEDGE_RE.fullmatch(pat)
+            if not m:
+                continue
+            left_b, phrase, right_b = m.groups()
+            entries = automaton.get(phrase, [])
+            entries.append(((category, i), phrase, bool(left_b), bool(right_b)))
+            automaton.add_word(phrase, entries)
+            literal_keys.add((category, i))
+    automaton.make_automaton()
+    return automaton, frozenset(literal_keys)
+
+
+_HEDGE_AC, _HEDGE_AC_KEYS = _build_hedge_automaton()
+
+
+def _is_word_boundary(text, i):
+    """Same test as regex \\b at index i."""
+    before = i > 0 and (text[i - 1].isalnum() or text[i - 1] == '_')
+    after = i < len(text) and (text[i].isalnum() or text[i] == '_')
+    return before != after
+
+
+def _literal_hedge_hits(text_lower):
+    """One automaton pass; returns {(category, index): [matched phrases]}.
+
+    Mirrors re.finditer per pattern: \\b checks at both ends, and hits of the
+    same pattern never overlap.
+    """
+    hits = {}
+    last_end = {}
+    for end, entries in _HEDGE_AC.iter(text_lower):
+        stop = end + 1
+        for key, phrase, left_b, right_b in entries:
+            start = stop - len(phrase)
+            if left_b and not _is_word_boundary(text_lower, start):
+                continue
+            if right_b and not _is_word_boundary(text_lower, stop):
+                continue
+            if start < last_end.get(key, 0):
+                continue
+            last_end[key] = stop
+            hits.setdefault(key, []).append(phrase)
+    return hits
+
+
+def detect_hedges(text_lower):
+    """Detect hedging expressions in lowercased text. Returns per-category counts and total."""
+    literal_hits = _literal_hedge_hits(text_lower) if _HEDGE_AC else {}
     results = {}
     total = 0
-    t_lower = text.lower()
-    for category, patterns in HEDGE_LEXICON.items():
+    for category, patterns in _HEDGE_RES.items():
         matches = []
-        for pat in patterns:
-            for m in re.finditer(pat, t_lower):
+        for i, pat in enumerate(patterns):
+            if (category, i) in _HEDGE_AC_KEYS:
+                matches.extend(literal_hits.get((category, i), ()))
+                continue
+            for m in pat.finditer(text_lower):
                 matches.append(m.group())
         results[category] = {'count': len(matches), 'examples': matches[:3]}
         total += len(matches)
     return total, results
 
 
-def hedge_density(text, n_sentences):
-    """Compute hedges per sentence for the text."""
-    total, _ = detect_hedges(text)
-    return round(total / max(n_sentences, 1), 2)
+def hedge_density(total_hedges, n_sentences):
+    """Compute hedges per sentence from a detect_hedges() total."""
+    return round(total_hedges / max(n_sentences, 1), 2)
 
 
 # ── Discourse: Information Density ───────────────────────────────
@@ -253,35 +392,46 @@ _NOUN = r'(?:[a-z]+-?[a-z]*(?:ion|ment|ness|ity|ance|ence|ing|sis|ics|ure|ogy|is
 # Technical terms: acronyms, hyphenated compounds, numbers with units
 _TECH = r'(?:[A-Z]{2,6}|\d+(?:\.\d+)?\s*(?:cm|nm|MHz|GHz|ms|μs|μm|mW|nJ|mm|kHz|THz|fs|ps|ns|eV|dB|mol|mM|μM|nM|%|°))'
 
+# Sentence boundary: whitespace after . ! ? and before a capital, unless the
+# period closes a protected abbreviation (one fixed-width lookbehind each).
+# Decimals (5.5) never split since the boundary needs whitespace.
+_SENT_SPLIT_RE = re.compile(
+    r'(?<!e\.g\.)(?<!i\.e\.)(?<!et al\.)(?<!Fig\.)(?<!Ext\.)'
+    r'(?<=[.!?])\s+(?=[A-Z])'
+)
+
+# Information-unit patterns (see count_information_units)
+# Acronyms and proper nouns never share characters (a proper noun is a whole
+# whitespace-delimited Capitalized word), so one scan finds both. Hyphenated
+# compounds and numbers do overlap acronyms (FT-SRS, 5 nm-scale) and keep
+# their own scans.
+_IU_RE = re.compile(
+    r'(?P<acro>\b[A-Z][A-Z0-9]{1,5}\b)'
+    r'|(?P<prop>(?<=\s)[A-Z][a-z]{3,}(?!\S))'
+)
+_ACRO_BLACKLIST = frozenset(('A', 'I', 'We'))
+_HAS_DIGIT_RE = re.compile(r'\d')
+_IU_NUM_RE = re.compile(r'\d+(?:\.\d+)?\s*(?:[-×]fold|cm⁻¹|nm|MHz|ms|μs|%|samples?|biomarkers?)')
+_IU_COMPARE_RE = re.compile(r'(?:more than|greater than|>)\s*\d+', re.IGNORECASE)
+_IU_HYPH_RE = re.compile(r'\b([a-zA-Z]+-[a-zA-Z]+(?:-[a-zA-Z]+)*)\b')
+_IU_DOMAIN_NP_RE = re.compile(
+    r'\b(spectral|temporal|spatial|optical|molecular|vibrational|clinical|biological|quantum)'
+    r'\s+(resolution|fidelity|bandwidth|sensitivity|interference|fingerprint\w*|analysis|imaging|detection|scattering|tissue|sample\w*)\b',
+    re.IGNORECASE,
+)
+
 
 def split_sentences(text):
     """Split text into sentences. Handles abbreviations and decimal numbers."""
-    # Protect common abbreviations
-    t = text.replace('e.g.', 'EG_PLACEHOLDER')
-    t = t.replace('i.e.', 'IE_PLACEHOLDER')
-    t = t.replace('et al.', 'ETAL_PLACEHOLDER')
-    t = t.replace('Fig.', 'FIG_PLACEHOLDER')
-    t = t.replace('Ext.', 'EXT_PLACEHOLDER')
-    # Protect decimal numbers (e.g., 5.5)
-    t = re.sub(r'(\d)\.(\d)', r'\1DECIMAL_PLACEHOLDER\2', t)
-    # Split on period/question/exclamation followed by space+capital or end
-    sents = re.split(r'(?<=[.!?])\s+(?=[A-Z])', t)
-    # Restore placeholders
-    restored = []
-    for s in sents:
-        s = s.replace('EG_PLACEHOLDER', 'e.g.')
-        s = s.replace('IE_PLACEHOLDER', 'i.e.')
-        s = s.replace('ETAL_PLACEHOLDER', 'et al.')
-        s = s.replace('FIG_PLACEHOLDER', 'Fig.')
-        s = s.replace('EXT_PLACEHOLDER', 'Ext.')
-        s = re.sub(r'(\d)DECIMAL_PLACEHOLDER(\d)', r'\1.\2', s)
-        restored.append(s.strip())
-    return [s for s in restored if s]
-
-
-def count_information_units(sentence):
+    return [s.strip() for s in _SENT_SPLIT_RE.split(text) if s.strip()]
+
+
+def count_information_units(sentence, keep_items=False):
     """Count information units (IU) in a sentence using regex noun-chunk proxy.
 
+    Returns (count, items); items is the list of units only with keep_items,
+    else None.
+
     IU sources:
       1. Technical acronyms (SRS, FID, SRL, etc.)
       2. Numbers with units (100×, 5.5 cm⁻¹, 92%, etc.)
@@ -291,46 +441,42 @@ def count_information_units(sentence):
     """
     iu_set = set()
 
-    # 1. Technical acronyms
-    for m in re.findall(r'\b([A-Z][A-Z0-9]{1,5})\b', sentence):
-        if m not in ('A', 'I', 'We'):
-            iu_set.add(f'ACRO:{m}')
+    # 1 + 3. Technical acronyms and capitalized proper nouns (4+ chars, not
+    # sentence-start); lstrip so a leading space never promotes the first word
+    for m in _IU_RE.finditer(sentence.lstrip()):
+        if m.lastgroup == 'acro':
+            if m.group() not in _ACRO_BLACKLIST:
+                iu_set.add(f'ACRO:{m.group()}')
+        else:
+            iu_set.add(f'PROP:{m.group()}')
 
     # 2. Numbers with units or comparators
-    for m in re.findall(r'\d+(?:\.\d+)?\s*(?:[-×]fold|cm⁻¹|nm|MHz|ms|μs|%|samples?|biomarkers?)', sentence):
-        iu_set.add(f'NUM:{m.strip()}')
-    # Also catch comparisons like ">100-fold", "orders of magnitude"
-    for m in re.findall(r'(?:more than|greater than|>)\s*\d+', sentence, re.IGNORECASE):
-        iu_set.add(f'NUM:{m.strip()}')
-
-    # 3. Capitalized proper nouns (4+ chars, not sentence-start)
-    words = sentence.split()
-    for i, w in enumerate(words):
-        if i > 0 and re.match(r'^[A-Z][a-z]{3,}$', w):
-            iu_set.add(f'PROP:{w}')
+    if _HAS_DIGIT_RE.search(sentence):
+        for m in _IU_NUM_RE.findall(sentence):
+            iu_set.add(f'NUM:{m.strip()}')
+        # Also catch comparisons like ">100-fold", "orders of magnitude"
+        for m in _IU_COMPARE_RE.findall(sentence):
+            iu_set.add(f'NUM:{m.strip()}')
 
     # 4. Hyphenated compounds
-    for m in re.findall(r'\b([a-zA-Z]+-[a-zA-Z]+(?:-[a-zA-Z]+)*)\b', sentence):
-        if len(m) >= 6:
-            iu_set.add(f'HYPH:{m.lower()}')
+    if '-' in sentence:
+        for m in _IU_HYPH_RE.findall(sentence):
+            if len(m) >= 6:
+                iu_set.add(f'HYPH:{m.lower()}')
 
     # 5. Domain noun phrases (adjective+noun patterns)
-    domain_patterns = [
-        r'\b(spectral|temporal|spatial|optical|molecular|vibrational|clinical|biological|quantum)'
-        r'\s+(resolution|fidelity|bandwidth|sensitivity|interference|fingerprint\w*|analysis|imaging|detection|scattering|tissue|sample\w*)\b',
-    ]
-    for pat in domain_patterns:
-        for m in re.findall(pat, sentence, re.IGNORECASE):
-            phrase = ' '.join(m).lower()
-            iu_set.add(f'NP:{phrase}')
+    for m in _IU_DOMAIN_NP_RE.findall(sentence):
+        phrase = ' '.join(m).lower()
+        iu_set.add(f'NP:{phrase}')
 
-    return len(iu_set), list(iu_set)
+    return len(iu_set), (list(iu_set) if keep_items else None)
 
 
-def info_density_profile(text):
+def info_density_profile(text, collect_items=False):
     """Compute information density per sentence.
 
-    Returns list of IU counts per sentence and a shape classification:
+    Returns list of IU counts per sentence, a shape classification and, with
+    collect_items, per-sentence details listing the units (else None). Shapes:
     - 'bell': density peaks in middle (optimal for Nature style)
     - 'front-loaded': density peaks early
     - 'back-loaded': density peaks late
@@ -339,14 +485,15 @@ def info_density_profile(text):
     """
     sentences = split_sentences(text)
     if not sentences:
-        return [], 'empty', []
+        return [], 'empty', [] if collect_items else None
 
     densities = []
-    details = []
+    details = [] if collect_items else None
     for s in sentences:
-        iu_count, iu_items = count_information_units(s)
+        iu_count, iu_items = count_information_units(s, keep_items=collect_items)
         densities.append(iu_count)
-        details.append({'sentence': s[:80], 'iu_count': iu_count, 'iu_items': iu_items})
+        if collect_items:
+            details.append({'sentence': s[:80], 'iu_count': iu_count, 'iu_items': iu_items})
 
     n = len(densities)
     if n < 3:
@@ -377,35 +524,72 @@ def info_density_profile(text):
 # ── Discourse: Domain-Shift Markers ──────────────────────────────
 
 DOMAIN_SHIFT_PATTERNS = [
-    r'(?i)as a (?:medical|clinical|practical|industrial) (?:application|demonstration|validation)',
-    r'(?i)for (?:clinical|practical|industrial|medical) (?:use|deployment|validation|translation)',
-    r'(?i)in (?:clinical|in vivo|ex vivo|human|patient) (?:settings?|samples?|tests?|studies|trials?)',
-    r'(?i)towards? (?:clinical|practical|medical|real-world)',
-    r'(?i)we (?:further|also) (?:demonstrate|show|apply|validate)',
+    r'as a (?:medical|clinical|practical|industrial) (?:application|demonstration|validation)',
+    r'for (?:clinical|practical|industrial|medical) (?:use|deployment|validation|translation)',
+    r'in (?:clinical|in vivo|ex vivo|human|patient) (?:settings?|samples?|tests?|studies|trials?)',
+    r'towards? (?:clinical|practical|medical|real-world)',
+    r'we (?:further|also) (?:demonstrate|show|apply|validate)',
 ]
 
+# One case-insensitive alternation; group N+1 is DOMAIN_SHIFT_PATTERNS[N]
+_DOMAIN_SHIFT_RE = re.compile(
+    '|'.join(f'({p})' for p in DOMAIN_SHIFT_PATTERNS), re.IGNORECASE,
+)
+
 
 def detect_domain_shifts(text):
     """Detect domain-shift markers in abstract text.
 
-    Returns list of detected markers with position info.
+    Returns list of detected markers with position info, in text order.
     """
     markers = []
-    for pat in DOMAIN_SHIFT_PATTERNS:
-        for m in re.finditer(pat, text):
-            markers.append({
-                'match': m.group(),
-                'position': m.start(),
-                'pattern': pat,
-            })
+    for m in _DOMAIN_SHIFT_RE.finditer(text):
+        markers.append({
+            'match': m.group(),
+            'position': m.start(),
+            'pattern': DOMAIN_SHIFT_PATTERNS[m.lastindex - 1],
+        })
     return markers
 
 
 # ── Main Analysis ────────────────────────────────────────────────
 
+# Below this many abstracts, process start-up costs more than the analysis saves
+_POOL_MIN_ABSTRACTS = 200
+
+
+def _analyze_one(text):
+    """Per-abstract text passes; returns only plain, picklable results."""
+    text_lower = text.lower()
+    tokens = tokenize(text_lower)
+    densities, shape, _ = info_density_profile(text)
+    verbs, here_we = extract_verbs(text)
+    return {
+        'verbs': verbs,
+        'here_we': here_we,
+        'bigrams': list(extract_ngrams(tokens, 2)),
+        'trigrams': list(extract_ngrams(tokens, 3)),
+        'hedges': detect_hedges(text_lower),
+        'densities': densities,
+        'shape': shape,
+        'markers': [m['match'] for m in detect_domain_shifts(text)],
+    }
+
+
+def _analyze_texts(texts):
+    """Run _analyze_one over texts in order; large corpora go to a process pool."""
+    if len(texts) >= _POOL_MIN_ABSTRACTS and (os.cpu_count() or 1) > 1:
+        try:
+            with ProcessPoolExecutor() as pool:
+                return list(pool.map(_analyze_one, texts, chunksize=4))
+        except (OSError, NotImplementedError):
+            pass  # no multiprocessing support here; run serially
+    return [_analyze_one(t) for t in texts]
+
+
 def analyze(abstracts_path, output_path, manuscript_keywords=None):
     with open(abstracts_path, 'r', encoding='utf-8') as f:
-        abstracts = yaml.safe_load(f)
+        abstracts = yaml.load(f, Loader=_YamlLoader)
 
     if not abstracts:
         print("❌ No abstracts to analyze", file=sys.stderr)
@@ -415,11 +599,15 @@ def analyze(abstracts_path, output_path, manuscript_keywords=None):
     valid = [a for a in abstracts if a.get('full_abstract')]
     print(f"📊 Analyzing {len(valid)} abstracts (of {len(abstracts)} total)")
 
+    # Text passes that only need the abstract itself run once per abstract here;
+    # the sections below aggregate their results in input order.
+    per_text = _analyze_texts([a['full_abstract'] for a in valid])
+
     # ── 1. Verb Frequency ──
     all_verbs = []
     per_abstract_verbs = []
-    for a in valid:
-        verbs = extract_verbs(a['full_abstract'])
+    for a, r in zip(valid, per_text):
+        verbs = r['verbs']
         all_verbs.extend(verbs)
         per_abstract_verbs.append({
             'doi': a['doi'],
@@ -432,15 +620,15 @@ def analyze(abstracts_path, output_path, manuscript_keywords=None):
     print(f"   Top 5: {', '.join(f'{v}({c})' for v, c in verb_freq[:5])}")
 
     # ── 2. N-gram Frequency ──
-    all_bigrams = []
-    all_trigrams = []
-    for a in valid:
-        all_bigrams.extend(extract_ngrams(a['full_abstract'], 2))
-        all_trigrams.extend(extract_ngrams(a['full_abstract'], 3))
-
-    bigram_freq = Counter(all_bigrams).most_common(30)
-    trigram_freq = Counter(all_trigrams).most_common(20)
-    print(f"✅ N-gram extraction: {len(set(all_bigrams))} unique bigrams, {len(set(all_trigrams))} unique trigrams")
+    bigram_counter = Counter()
+    trigram_counter = Counter()
+    for r in per_text:
+        bigram_counter.update(r['bigrams'])
+        trigram_counter.update(r['trigrams'])
+
+    bigram_freq = bigram_counter.most_common(30)
+    trigram_freq = trigram_counter.most_common(20)
+    print(f"✅ N-gram extraction: {len(bigram_counter)} unique bigrams, {len(trigram_counter)} unique trigrams")
     print(f"   Top 3 bigrams: {', '.join(f'{g}({c})' for g, c in bigram_freq[:3])}")
 
     # ── 3. Sentence Statistics ──
@@ -452,18 +640,20 @@ def analyze(abstracts_path, output_path, manuscript_keywords=None):
         word_counts.append(wc)
         sentence_counts.append(sc)
 
+    # Mean computed once and reused for the (population) std
+    wc_mean = statistics.fmean(word_counts)
     stats = {
         'n_abstracts': len(valid),
         'word_count': {
-            'mean': round(sum(word_counts) / len(word_counts), 1),
-            'median': sorted(word_counts)[len(word_counts) // 2],
+            'mean': round(wc_mean, 1),
+            'median': statistics.median_high(word_counts),
             'min': min(word_counts),
             'max': max(word_counts),
-            'std': round((sum((x - sum(word_counts)/len(word_counts))**2 for x in word_counts) / len(word_counts))**0.5, 1),
+            'std': round(statistics.pstdev(word_counts, wc_mean), 1),
         },
         'sentence_count': {
-            'mean': round(sum(sentence_counts) / len(sentence_counts), 1),
-            'median': sorted(sentence_counts)[len(sentence_counts) // 2],
+            'mean': round(statistics.fmean(sentence_counts), 1),
+            'median': statistics.median_high(sentence_counts),
             'min': min(sentence_counts),
             'max': max(sentence_counts),
         },
@@ -509,12 +699,11 @@ def analyze(abstracts_path, output_path, manuscript_keywords=None):
     hedge_densities = []
     hedge_totals = []
     all_hedge_categories = Counter()
-    for a in valid:
-        text = a['full_abstract']
+    for a, r in zip(valid, per_text):
         n_sents = a.get('sentence_count', 0) or len(a.get('sentences', []))
-        total_h, cats = detect_hedges(text)
+        total_h, cats = r['hedges']
         hedge_totals.append(total_h)
-        hd = hedge_density(text, max(n_sents, 1))
+        hd = hedge_density(total_h, n_sents)
         hedge_densities.append(hd)
         for cat, info in cats.items():
             all_hedge_categories[cat] += info['count']
@@ -526,8 +715,8 @@ def analyze(abstracts_path, output_path, manuscript_keywords=None):
     density_shapes = Counter()
     all_densities = []
     density_examples = []
-    for a in valid:
-        densities, shape, details = info_density_profile(a['full_abstract'])
+    for a, r in zip(valid, per_text):
+        densities, shape = r['densities'], r['shape']
         density_shapes[shape] += 1
         all_densities.extend(densities)
         if len(density_examples) < 3:  # save a few examples
@@ -544,14 +733,14 @@ def analyze(abstracts_path, output_path, manuscript_keywords=None):
     # ── 9. Discourse: Domain-Shift Markers ──
     n_with_markers = 0
     marker_examples = []
-    for a in valid:
-        markers = detect_domain_shifts(a['full_abstract'])
+    for a, r in zip(valid, per_text):
+        markers = r['markers']
         if markers:
             n_with_markers += 1
             if len(marker_examples) < 5:
                 marker_examples.append({
                     'doi': a['doi'],
-                    'markers': [m['match'] for m in markers],
+                    'markers': markers,
                 })
 
     marker_pct = round(100 * n_with_markers / max(len(valid), 1), 1)
@@ -562,14 +751,10 @@ def analyze(abstracts_path, output_path, manuscript_keywords=None):
     # ── 6. "Here we" pivot analysis ──
     here_we_count = 0
     here_we_verbs = Counter()
-    for a in valid:
-        text = a['full_abstract']
-        matches = re.findall(r'[Hh]ere\s+we\s+(\w+)', text)
-        if matches:
+    for r in per_text:
+        if r['here_we']:
             here_we_count += 1
-            for v in matches:
-                v_norm = VERB_NORMALIZE.get(v.lower(), v.lower())
-                here_we_verbs[v_norm] += 1
+            here_we_verbs.update(r['here_we'])
 
     # ── Assemble Output ──
     result = {
@@ -643,8 +828,12 @@ def analyze(abstracts_path, output_path, manuscript_keywords=None):
 
     # Save
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
 
     print(f"\n{'='*50}")
     print(f"✅ Analysis saved to {output_path}")
@@ -658,7 +847,7 @@ def analyze(abstracts_path, output_path, manuscript_keywords=None):
 
 # Stopwords: covers English function words, academic headers, Markdown noise,
 # common scientific verbs. Case-insensitive matching applied in the function.
-_KW_STOPS = {
+_KW_STOPS = frozenset({
     # English function words & auxiliaries
     'the', 'for', 'with', 'from', 'this', 'and', 'not', 'while', 'here',
     'what', 'how', 'but', 'also', 'only', 'most', 'each', 'both', 'all',
@@ -693,7 +882,27 @@ _KW_STOPS = {
     'state-of-the-art', 'high-quality', 'high-speed', 'high-fidelity',
     'high-performance', 'high-throughput', 'high-resolution', 'high-sensitivity',
     'label-free', 'real-time', 'large-scale', 'long-term', 'low-cost',
-}
+})
+
+
+# Semantic-core sections (see extract_keywords_from_semantic_core)
+_FACT_SECTION_RE = re.compile(r'## 1\. Fact Base.*?(?=## 2\.|$)', re.DOTALL)
+_CLAIMS_SECTION_RE = re.compile(r'## 3\. Claims.*?(?=$)', re.DOTALL)
+_LOGIC_SECTION_RE = re.compile(r'## 2\. Logic Graph.*?(?=## 3\.|$)', re.DOTALL)
+
+# Term patterns and Markdown table noise (see _extract_terms)
+# Table row IDs (F1, C12) and pipe/star/header marks, blanked in one pass
+_TABLE_NOISE_RE = re.compile(r'\b[FC]\d{1,2}\b|[|★#]')
+_WS_RE = re.compile(r'\s+')
+# Acronyms and proper nouns are whole words that never overlap, so one scan
+# finds both; hyphenated compounds overlap them ('Near' in 'Near-field').
+# Stop words long enough to be proper nouns are rejected inside the regex by a
+# case-insensitive lookahead, so that arm needs no _KW_STOPS check afterwards.
+_KW_PROPER_STOPS = '|'.join(sorted((w for w in _KW_STOPS if w.isalpha() and len(w) >= 4),
+                                   key=lambda w: (-len(w), w)))
+_KW_TERM_RE = re.compile(r'(?P<acro>\b[A-Z][A-Z0-9]{2,5}\b)'
+                         rf'|(?P<prop>\b(?!(?i:{_KW_PROPER_STOPS})\b)[A-Z][a-z]{{3,}}\b)')
+_KW_HYPH_RE = re.compile(r'\b([a-zA-Z]+-[a-zA-Z]+(?:-[a-zA-Z]+)*)\b')
 
 
 def extract_keywords_from_semantic_core(content):
@@ -715,17 +924,17 @@ def extract_keywords_from_semantic_core(content):
 
     # Fact Base rows: flexible pattern that works even if column count varies
     # Looks for F<number> followed by table cells
-    fact_section = re.search(r'## 1\. Fact Base.*?(?=## 2\.|$)', content, re.DOTALL)
+    fact_section = _FACT_SECTION_RE.search(content)
     if fact_section:
         _extract_terms(fact_section.group(), candidates)
 
     # Claims section
-    claims_section = re.search(r'## 3\. Claims.*?(?=$)', content, re.DOTALL)
+    claims_section = _CLAIMS_SECTION_RE.search(content)
     if claims_section:
         _extract_terms(claims_section.group(), candidates)
 
     # Logic Graph section
-    logic_section = re.search(r'## 2\. Logic Graph.*?(?=## 3\.|$)', content, re.DOTALL)
+    logic_section = _LOGIC_SECTION_RE.search(content)
     if logic_section:
         _extract_terms(logic_section.group(), candidates)
 
@@ -736,30 +945,34 @@ def extract_keywords_from_semantic_core(content):
 
     # ── Rank by whole-document frequency × type weight ───────────
     # Type weights: acronyms are most informative, then hyphenated, then names
+    # Occurrences in the full document (case-sensitive for acronyms), counted
+    # for all candidates in one pass per casing
+    acronym_counts = _keyword_counts([t for t in candidates if t.isupper()], [content])
+    lower_counts = _keyword_counts(
+        [t.lower() for t in candidates if not t.isupper()], [content.lower()])
     scored = []
     for term, section_freq in candidates.items():
-        # Count occurrences in the full document (case-sensitive for acronyms)
         if term.isupper():
-            doc_freq = len(re.findall(re.escape(term), content))
+            doc_freq = acronym_counts[term][0]
             weight = 3.0  # acronyms are highly specific
         elif '-' in term:
-            doc_freq = content.lower().count(term.lower())
+            doc_freq = lower_counts[term.lower()][0]
             weight = 2.0  # hyphenated compounds are specific
         else:
-            doc_freq = content.lower().count(term.lower())
+            doc_freq = lower_counts[term.lower()][0]
             weight = 1.0  # capitalized proper nouns
         score = weight * max(doc_freq, section_freq)
         scored.append((term, score, doc_freq))
 
-    # Sort by score descending, take top 15
-    scored.sort(key=lambda x: -x[1])
-    keywords = [t[0] for t in scored[:15]]
+    # Top 15 by score; nlargest keeps first-seen order among ties, like a sort
+    top = heapq.nlargest(15, scored, key=lambda x: x[1])
+    keywords = [t[0] for t in top]
 
     if not keywords:
         print("   ⚠️ No keywords extracted — check manuscript_semantic_core.md format")
     else:
         # Debug: show top 5 with scores
-        top5_debug = ', '.join(f'{t[0]}({t[2]}×)' for t in scored[:5])
+        top5_debug = ', '.join(f'{t[0]}({t[2]}×)' for t in top[:5])
         print(f"   🔍 Top-5 by score: {top5_debug}")
 
     return keywords
@@ -772,34 +985,36 @@ def _extract_terms(text, counter):
            capitalized proper nouns (4+ chars). Filters by _KW_STOPS.
     Pre-processing: strips Markdown table row IDs, pipe chars, star ratings.
     """
-    # Pre-clean: remove Markdown table noise
-    # 1. Remove table row markers: | F1 |, | C2 |, | F11 |, etc.
-    clean = re.sub(r'\b[FC]\d{1,2}\b', '', text)
-    # 2. Remove pipe chars, star ratings (★), markdown headers (#)
-    clean = re.sub(r'[|★#]', ' ', clean)
-    # 3. Collapse multiple spaces
-    clean = re.sub(r'\s+', ' ', clean)
+    # Pre-clean: blank Markdown table noise, then collapse whitespace.
+    # Noise: row markers (| F1 |, | C2 |, | F11 |), pipe chars, star ratings
+    # (★), markdown headers (#). A row ID sits between non-word characters, so
+    # blanking it instead of deleting it cannot create or split a term.
+    clean = _WS_RE.sub(' ', _TABLE_NOISE_RE.sub(' ', text))
 
     # ALL-CAPS acronyms: SRS, FID, TERS, SNR, etc.
     # Require 3+ chars to avoid noise (ON, OF, NA, EF, NO, etc.)
-    for m in re.findall(r'\b([A-Z][A-Z0-9]{2,5})\b', clean):
-        if m.lower() not in _KW_STOPS:
-            counter[m] += 1
+    # Proper nouns come out of the same scan but are counted last, keeping the
+    # acronym → compound → name insertion order that breaks score ties.
+    proper_nouns = []
+    for m in _KW_TERM_RE.finditer(clean):
+        if m.lastgroup == 'acro':
+            if m.group().lower() not in _KW_STOPS:
+                counter[m.group()] += 1
+        else:
+            proper_nouns.append(m.group())
 
     # Hyphenated compounds: near-field, few-cycle, lock-in, etc.
-    for m in re.findall(r'\b([a-zA-Z]+-[a-zA-Z]+(?:-[a-zA-Z]+)*)\b', clean):
-        parts = m.lower().split('-')
-        if len(m) >= 6 and not all(p in _KW_STOPS for p in parts):
-            # Always normalize to lowercase to merge Side-lobe/side-lobe
-            normalized = m.lower()
-            if normalized not in _KW_STOPS:
-                counter[normalized] += 1
+    # Always normalize to lowercase to merge Side-lobe/side-lobe
+    compounds = (m.group().lower() for m in _KW_HYPH_RE.finditer(clean) if len(m.group()) >= 6)
+    counter.update(
+        c for c in compounds
+        if c not in _KW_STOPS and not all(p in _KW_STOPS for p in c.split('-'))
+    )
 
     # Capitalized proper nouns: Raman, Fourier, SuperB, etc.
-    # Must be 4+ chars to avoid "The", "And", etc.
-    for m in re.findall(r'\b([A-Z][a-z]{3,})\b', clean):
-        if m.lower() not in _KW_STOPS:
-            counter[m] += 1
+    # Must be 4+ chars to avoid "The", "And", etc.; stop words are already
+    # excluded by _KW_TERM_RE.
+    counter.update(proper_nouns)
 
 
 def main():
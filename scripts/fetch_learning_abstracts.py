@@ -1,12 +1,29 @@
 """Fetch full abstracts for the 20 selected learning articles.
 
-Reads selected_20.yaml, pulls DOIs from articles_raw.yaml,
+Reads selected_20.yaml, pulls DOIs from articles_raw (.yaml/.json, optionally .gz),
 fetches full abstracts from nature.com, and saves to
 knowledge_base/abstracts_20.yaml — structured for Move analysis.
 """
-import sys, time, re, yaml, requests
+import sys, re, gzip, json, yaml, requests
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from pathlib import Path
-from bs4 import BeautifulSoup
+from nature_pages import fetch_full_abstract, is_cached, spaced
+
+try:
+    import requests_cache  # optional: persistent page cache between runs
+except ImportError:
+    requests_cache = None
+
+try:
+    import orjson  # optional: fast JSON for articles_raw.json
+except ImportError:
+    orjson = None
+
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper  # libyaml-backed
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
 
 BASE_URL = "https://www.nature.com"
 HEADERS = {
@@ -15,57 +32,66 @@ HEADERS = {
     "Accept": "text/html,application/xhtml+xml",
     "Accept-Language": "en-US,en;q=0.9",
 }
-RATE_LIMIT = 2.0
+RATE_LIMIT = 2.0    # seconds between request starts
+FETCH_WORKERS = 4   # concurrent fetches; overlaps network latency, not the rate
+PAGE_CACHE_DAYS = 30
+ARTICLES_RAW_EXTS = ("yaml", "yaml.gz", "json", "json.gz")  # scrape_nphoton.py --format / --compress
 
 
-def fetch_page(url, session):
-    try:
-        resp = session.get(url, headers=HEADERS, timeout=20)
-        resp.raise_for_status()
-        return BeautifulSoup(resp.text, "html.parser")
-    except Exception as e:
-        print(f"  ⚠ Failed: {url}: {e}", file=sys.stderr)
-        return None
+def make_session(base):
+    """HTTP session; with requests_cache, pages persist in <base>/.cache for re-runs."""
+    if requests_cache is None:
+        session = requests.Session()
+    else:
+        session = requests_cache.CachedSession(
+            str(base / ".cache" / "nature_pages"), backend="sqlite",
+            expire_after=timedelta(days=PAGE_CACHE_DAYS),
+            allowable_codes=(200, 404),  # a missing article stays missing
+        )
+        session.cache.delete(expired=True)  # so is_cached() only sees live entries
+    session.headers.update(HEADERS)
+    return session
 
 
-def fetch_full_abstract(url, session):
-    """Fetch abstract from a Nature article page."""
-    soup = fetch_page(url, session)
-    if not soup:
-        return None
+# Split on whitespace after sentence-ending punctuation and before a capital,
+# unless the period closes a common abbreviation (one fixed-width lookbehind each)
+_SENT_SPLIT_RE = re.compile(
+    r'(?<!\bFig\.)(?<!\bFigs\.)(?<!\bRef\.)(?<!\bRefs\.)(?<!\bet al\.)'
+    r'(?<!\bi\.e\.)(?<!\be\.g\.)(?<!\bvs\.)(?<!\bDr\.)(?<!\bMr\.)(?<!\bMrs\.)(?<!\betc\.)'
+    r'(?<=[.!?])\s+(?=[A-Z])'
+)
 
-    # Primary: structured abstract div
-    abs_div = soup.find("div", id="Abs1-content")
-    if abs_div:
-        return abs_div.get_text(separator=" ", strip=True)
 
-    # Fallback: section with data-title="Abstract"
-    abs_section = soup.find("section", attrs={"data-title": "Abstract"})
-    if abs_section:
-        content = abs_section.find("div", class_="c-article-section__content")
-        if content:
-            return content.get_text(separator=" ", strip=True)
+def split_into_sentences(text):
+    """Split abstract text into individual sentences."""
+    return [s.strip() for s in _SENT_SPLIT_RE.split(text) if s.strip()]
 
-    # Last resort: meta description
-    meta = soup.find("meta", attrs={"name": "description"})
-    if meta and meta.get("content"):
-        return meta["content"]
 
-    return None
+def open_text(path, mode="r"):
+    """Open a UTF-8 text file; *.gz paths (scrape_nphoton.py --compress) go through gzip."""
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + "t", encoding="utf-8", compresslevel=6)
+    return open(path, mode, encoding="utf-8")
 
 
-def split_into_sentences(text):
-    """Split abstract text into individual sentences."""
-    # Handle common abbreviations that contain periods
-    text = re.sub(r'\b(Fig|Figs|Ref|Refs|et al|i\.e|e\.g|vs|Dr|Mr|Mrs|etc)\.',
-                  lambda m: m.group(0).replace('.', '<DOT>'), text)
-    # Split on sentence-ending punctuation
-    sentences = re.split(r'(?<=[.!?])\s+(?=[A-Z])', text)
-    # Restore dots
-    sentences = [s.replace('<DOT>', '.').strip() for s in sentences if s.strip()]
-    return sentences
+def load_articles(path):
+    """Load articles_raw in whichever format scrape_nphoton.py wrote it (YAML or JSON)."""
+    with open_text(path) as f:
+        if ".json" in path.suffixes:
+            return orjson.loads(f.read()) if orjson else json.load(f)
+        return yaml.load(f, Loader=_YamlLoader)
 
 
+def save_articles(articles, path):
+    """Write articles back to path in the same format and compression it was read from."""
+    with open_text(path, "w") as f:
+        if ".json" not in path.suffixes:
+            yaml.dump(articles, f, Dumper=_YamlDumper, allow_unicode=True, default_flow_style=False, sort_keys=False)
+        elif orjson:
+            f.write(orjson.dumps(articles, option=orjson.OPT_INDENT_2).decode("utf-8"))
+        else:
+            json.dump(articles, f, indent=2, ensure_ascii=False)
+
 
 def auto_select_20(articles, output_path):
     """Legacy fallback: auto-select 20 articles when selected_20.yaml is missing.
@@ -80,20 +106,21 @@ def auto_select_20(articles, output_path):
     - 10 'archetype_relevant': newest Reviews, Perspectives, Comments, News & Views
     If fewer than 10 in either category, fill from the other.
     """
-    research_types = {"Article", "Research", "Letter", "Brief Communication"}
-    archetype_types = {"Review Article", "Review", "Perspective", "Comment",
-                       "News & Views", "Editorial", "Correspondence", "Analysis"}
+    # Matched as lowercase substrings of the article type
+    research_types = ("article", "research", "letter", "brief communication")
+    archetype_types = ("review article", "review", "perspective", "comment",
+                       "news & views", "editorial", "correspondence", "analysis")
 
     research = []
     archetype = []
     for a in articles:
-        atype = a.get("article_type", "")
         doi = a.get("doi", "")
         if not doi:
             continue
-        if any(rt.lower() in atype.lower() for rt in research_types):
+        atype = a.get("article_type", "").lower()
+        if any(rt in atype for rt in research_types):
             research.append(a)
-        elif any(at.lower() in atype.lower() for at in archetype_types):
+        elif any(at in atype for at in archetype_types):
             archetype.append(a)
         else:
             # Default: treat as research
@@ -107,12 +134,14 @@ def auto_select_20(articles, output_path):
     topic_picks = research[:10]
     arch_picks = archetype[:10]
 
-    # Fill shortfalls
+    # Fill shortfalls (skip DOIs the other group already picked)
     if len(topic_picks) < 10:
-        extra = [a for a in archetype[10:] if a not in arch_picks]
+        picked = {a["doi"] for a in arch_picks}
+        extra = [a for a in archetype[10:] if a["doi"] not in picked]
         topic_picks += extra[:10 - len(topic_picks)]
     if len(arch_picks) < 10:
-        extra = [a for a in research[10:] if a not in topic_picks]
+        picked = {a["doi"] for a in topic_picks}
+        extra = [a for a in research[10:] if a["doi"] not in picked]
         arch_picks += extra[:10 - len(arch_picks)]
 
     selected = {
@@ -128,7 +157,7 @@ def auto_select_20(articles, output_path):
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
     with open(output_path, "w", encoding="utf-8") as f:
-        yaml.dump(selected, f, allow_unicode=True, default_flow_style=False, sort_keys=False, width=200)
+        yaml.dump(selected, f, Dumper=_YamlDumper, allow_unicode=True, default_flow_style=False, sort_keys=False, width=200)
 
     total = len(selected["topic_relevant"]) + len(selected["archetype_relevant"])
     print(f"✅ Auto-generated {output_path.name}: {total} articles selected")
@@ -141,25 +170,30 @@ def main():
     # Auto-detect project root: scripts/ is one level below project root
     base = Path(__file__).resolve().parent.parent
     articles_path = base / "trend_data" / "articles_raw.yaml"
+    # Prefer whichever articles_raw variant (.yaml/.json, optionally .gz) the scraper wrote last
+    variants = [p for p in (articles_path.with_name(f"articles_raw.{ext}")
+                            for ext in ARTICLES_RAW_EXTS) if p.exists()]
+    if variants:
+        articles_path = max(variants, key=lambda p: p.stat().st_mtime)
     selected_path = base / "knowledge_base" / "selected_20.yaml"
     output_path = base / "knowledge_base" / "abstracts_20.yaml"
 
-    # ── Pre-flight: check articles_raw.yaml exists ──
+    # ── Pre-flight: check an articles_raw data file exists ──
     if not articles_path.exists():
-        print("❌ ERROR: trend_data/articles_raw.yaml not found!", file=sys.stderr)
+        accepted = ", ".join(f"articles_raw.{ext}" for ext in ARTICLES_RAW_EXTS)
+        print(f"❌ ERROR: no articles_raw data file in trend_data/ (looked for {accepted})!", file=sys.stderr)
         print("   Run scrape_nphoton.py first:", file=sys.stderr)
         print('   python scripts/scrape_nphoton.py --months 6 --output ./trend_data/', file=sys.stderr)
         sys.exit(1)
 
     # Load articles
-    with open(articles_path, "r", encoding="utf-8") as f:
-        articles = yaml.safe_load(f)
+    articles = load_articles(articles_path)
 
     if not articles:
-        print("❌ ERROR: articles_raw.yaml is empty!", file=sys.stderr)
+        print(f"❌ ERROR: {articles_path.name} is empty!", file=sys.stderr)
         sys.exit(1)
 
-    print(f"📄 Loaded {len(articles)} articles from articles_raw.yaml")
+    print(f"📄 Loaded {len(articles)} articles from {articles_path.name}")
 
     # ── Auto-select if selected_20.yaml is missing ──
     if not selected_path.exists():
@@ -168,15 +202,21 @@ def main():
         selected = auto_select_20(articles, selected_path)
     else:
         with open(selected_path, "r", encoding="utf-8") as f:
-            selected = yaml.safe_load(f)
+            selected = yaml.load(f, Loader=_YamlLoader)
         print(f"✓ Loaded existing {selected_path.name}")
 
+    # One pass over the selection: DOI → group (the later group wins, as the
+    # old per-article scan did) and DOI → reason (the first listing wins)
     target_dois = set()
+    group_of = {}
+    reason_of = {}
     for group in ["topic_relevant", "archetype_relevant"]:
         for item in selected.get(group, []):
             doi = item.get("doi", "")
             if doi:
                 target_dois.add(doi)
+                group_of[doi] = group
+                reason_of.setdefault(doi, item.get("why", ""))
 
     if not target_dois:
         print("❌ ERROR: No DOIs found in selected_20.yaml!", file=sys.stderr)
@@ -184,85 +224,90 @@ def main():
 
     print(f"🎯 {len(target_dois)} target DOIs loaded")
 
-    # Find matching articles in articles_raw.yaml
+    # Find matching articles in the articles_raw data file
     targets = []
     for a in articles:
         if a.get("doi") in target_dois:
             targets.append(a)
 
-    print(f"📋 {len(targets)} articles matched in articles_raw.yaml")
+    print(f"📋 {len(targets)} articles matched in {articles_path.name}")
 
     if not targets:
-        print("❌ ERROR: No matching articles found! DOIs in selected_20.yaml don't match articles_raw.yaml.", file=sys.stderr)
+        print(f"❌ ERROR: No matching articles found! DOIs in selected_20.yaml don't match {articles_path.name}.", file=sys.stderr)
         print("   Try deleting selected_20.yaml and re-running to auto-select.", file=sys.stderr)
         sys.exit(1)
 
-    # Fetch abstracts
-    session = requests.Session()
-    results = []
+    # Fetch missing abstracts concurrently; request starts stay RATE_LIMIT apart
+    # Cached pages skip the spacing, since they never reach the site
+    session = make_session(base)
+    pending = [i for i, a in enumerate(targets) if not a.get("full_abstract")]
+    if pending:
+        print(f"🌐 Fetching {len(pending)} abstracts ({FETCH_WORKERS} workers)...")
+    spaced_fetch = spaced(lambda url: fetch_full_abstract(url, session), RATE_LIMIT)
 
-    for i, a in enumerate(targets):
-        title = a["title"][:60]
-        url = a.get("url", "")
-        doi = a.get("doi", "")
-        print(f"\n[{i+1}/{len(targets)}] {title}...")
+    def fetch(url):
+        if is_cached(session, url):
+            return fetch_full_abstract(url, session)
+        return spaced_fetch(url)
 
-        # Check if already has full_abstract
-        if a.get("full_abstract"):
-            abstract_text = a["full_abstract"]
-            print(f"  ✓ Already cached ({len(abstract_text)} chars)")
-        else:
-            abstract_text = fetch_full_abstract(url, session)
-            if abstract_text:
-                print(f"  ✓ Fetched ({len(abstract_text)} chars)")
-                # Also update the main articles_raw.yaml
-                a["full_abstract"] = abstract_text
+    results = []
+    dirty = False  # set once any abstract is written back into articles
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+        # Consumed in target order as each fetch completes
+        new_abstracts = pool.map(fetch, (targets[i].get("url", "") for i in pending))
+        for i, a in enumerate(targets):
+            title = a["title"][:60]
+            url = a.get("url", "")
+            doi = a.get("doi", "")
+            log = [f"\n[{i+1}/{len(targets)}] {title}..."]  # this article's status, printed at once
+
+            # Check if already has full_abstract
+            if a.get("full_abstract"):
+                abstract_text = a["full_abstract"]
+                log.append(f"  ✓ Already cached ({len(abstract_text)} chars)")
             else:
-                print(f"  ✗ Could not fetch")
-                abstract_text = a.get("abstract_snippet", "")
-            time.sleep(RATE_LIMIT)
-
-        # Split into sentences
-        sentences = split_into_sentences(abstract_text) if abstract_text else []
-
-        # Determine which group
-        group = "unknown"
-        for g in ["topic_relevant", "archetype_relevant"]:
-            for item in selected.get(g, []):
-                if item.get("doi") == doi:
-                    group = g
-                    break
-
-        results.append({
-            "doi": doi,
-            "title": a["title"],
-            "url": url,
-            "article_type": a.get("article_type", ""),
-            "date": a.get("date", ""),
-            "group": group,
-            "selection_reason": next(
-                (item["why"] for g in ["topic_relevant", "archetype_relevant"]
-                 for item in selected.get(g, []) if item.get("doi") == doi),
-                ""
-            ),
-            "full_abstract": abstract_text or "",
-            "sentences": [
-                {"position": f"S{j+1}", "text": s}
-                for j, s in enumerate(sentences)
-            ],
-            "sentence_count": len(sentences),
-        })
+                abstract_text = next(new_abstracts)
+                if abstract_text:
+                    log.append(f"  ✓ Fetched ({len(abstract_text)} chars)")
+                    # Also update the main articles_raw data file
+                    a["full_abstract"] = abstract_text
+                    dirty = True
+                else:
+                    log.append(f"  ✗ Could not fetch")
+                    abstract_text = a.get("abstract_snippet", "")
+
+            # Split into sentences
+            sentences = split_into_sentences(abstract_text) if abstract_text else []
+
+            results.append({
+                "doi": doi,
+                "title": a["title"],
+                "url": url,
+                "article_type": a.get("article_type", ""),
+                "date": a.get("date", ""),
+                "group": group_of.get(doi, "unknown"),
+                "selection_reason": reason_of.get(doi, ""),
+                "full_abstract": abstract_text or "",
+                "sentences": [
+                    {"position": f"S{j+1}", "text": s}
+                    for j, s in enumerate(sentences)
+                ],
+                "sentence_count": len(sentences),
+            })
+            print("\n".join(log))
 
     # Save structured output
     output_path.parent.mkdir(parents=True, exist_ok=True)
     with open(output_path, "w", encoding="utf-8") as f:
-        yaml.dump(results, f, allow_unicode=True, default_flow_style=False, sort_keys=False, width=200)
+        yaml.dump(results, f, Dumper=_YamlDumper, allow_unicode=True, default_flow_style=False, sort_keys=False, width=200)
     print(f"\n✓ Saved {len(results)} structured abstracts to {output_path}")
 
-    # Also update articles_raw.yaml with fetched abstracts
-    with open(articles_path, "w", encoding="utf-8") as f:
-        yaml.dump(articles, f, allow_unicode=True, default_flow_style=False, sort_keys=False)
-    print(f"✓ Updated articles_raw.yaml with new abstracts")
+    # Also update the articles_raw data file with fetched abstracts (only if any were new)
+    if dirty:
+        save_articles(articles, articles_path)
+        print(f"✓ Updated {articles_path.name} with new abstracts")
+    else:
+        print(f"✓ {articles_path.name} unchanged (no new abstracts)")
 
     # Summary
     fetched = sum(1 for r in results if r["full_abstract"])
@@ -0,0 +1,202 @@
+"""
+Page-fetching helpers shared by scrape_nphoton.py and fetch_learning_abstracts.py
+================================================================================
+Both scripts run as plain files from scripts/, so this module is imported
+directly (no package). Sessions are created by each script; they are
+expected to carry the request headers (session.headers) and, optionally,
+a requests_cache page cache.
+"""
+
+import sys
+import threading
+import time
+from typing import Callable, Optional
+
+import requests
+from bs4 import BeautifulSoup
+from bs4.dammit import EncodingDetector
+
+try:
+    from lxml import etree, html as lxml_html  # optional: C-backed parsing
+    HTML_PARSER = "lxml"
+except ImportError:
+    lxml_html = None
+    HTML_PARSER = "html.parser"
+
+FETCH_TIMEOUT = 30  # seconds per page request
+
+
+# ---------------------------------------------------------------------------
+# Rate Limiting & Cache
+# ---------------------------------------------------------------------------
+def spaced(fn: Callable, interval: float) -> Callable:
+    """Wrap fn so successive calls (from any thread) start interval seconds apart.
+
+    wrapper.pause(seconds) holds back every later call for at least that long,
+    e.g. after the remote site answers 429.
+    """
+    lock = threading.Lock()
+    next_start = [0.0]
+    pauses = [0]  # bumped by pause(); calls already waiting then take a new slot
+
+    def wrapper(*args):
+        while True:
+            with lock:
+                now = time.monotonic()
+                wait = next_start[0] - now
+                next_start[0] = max(now, next_start[0]) + interval
+                generation = pauses[0]
+            if wait > 0:
+                time.sleep(wait)
+            if pauses[0] == generation:
+                return fn(*args)
+
+    def pause(seconds: float) -> None:
+        with lock:
+            next_start[0] = max(next_start[0], time.monotonic() + seconds)
+            pauses[0] += 1
+
+    wrapper.pause = pause
+    return wrapper
+
+
+def is_cached(session: requests.Session, url: str) -> bool:
+    """True if url will be answered from the page cache (no request to the site)."""
+    cache = getattr(session, "cache", None)
+    return cache is not None and cache.contains(url=url)
+
+
+# ---------------------------------------------------------------------------
+# Page Fetching
+# ---------------------------------------------------------------------------
+def _decode_html(resp: requests.Response) -> str:
+    """Page text using the HTTP charset, else the page's declared one, else UTF-8.
+
+    resp.text would fall back to ISO-8859-1 whenever the server sends no charset.
+    """
+    encoding = resp.encoding if "charset" in resp.headers.get("Content-Type", "").lower() else None
+    encoding = encoding or EncodingDetector.find_declared_encoding(resp.content, is_html=True) or "utf-8"
+    try:
+        return resp.content.decode(encoding, errors="replace")
+    except LookupError:
+        return resp.content.decode("utf-8", errors="replace")
+
+
+def fetch_page(url: str, session: requests.Session) -> Optional[BeautifulSoup]:
+    """Fetch a page and return parsed BeautifulSoup, or None on failure."""
+    try:
+        resp = session.get(url, timeout=FETCH_TIMEOUT)
+        resp.raise_for_status()
+        return BeautifulSoup(_decode_html(resp), HTML_PARSER)
+    except Exception as e:
+        print(f"  ⚠ Failed to fetch {url}: {e}", file=sys.stderr)
+        return None
+
+
+def fetch_tree(url: str, session: requests.Session):
+    """Like fetch_page, but returns an lxml document (None for an empty page).
+
+    Only available when lxml is installed.
+    """
+    try:
+        resp = session.get(url, timeout=FETCH_TIMEOUT)
+        resp.raise_for_status()
+        markup = _decode_html(resp)
+        if not markup.strip():
+            return None
+        # Re-encoded so pages with an XML encoding declaration still parse
+        return lxml_html.document_fromstring(markup.encode("utf-8"), parser=_UTF8_HTML_PARSER)
+    except Exception as e:
+        print(f"  ⚠ Failed to fetch {url}: {e}", file=sys.stderr)
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Full Abstract Fetcher
+# ---------------------------------------------------------------------------
+if lxml_html is not None:
+    _UTF8_HTML_PARSER = lxml_html.HTMLParser(encoding="utf-8")
+    # Every abstract location fetch_full_abstract looks at, in document order,
+    # from a single tree walk
+    _ABSTRACT_XPATH = etree.XPath(
+        '//div[@id="Abs1-content"] | //section[@data-title="Abstract"]'
+        ' | //meta[@name="description"]'
+    )
+    _SECTION_CONTENT_XPATH = etree.XPath(
+        './/div[contains(concat(" ", normalize-space(@class), " "), " c-article-section__content ")]'
+    )
+
+# Text BeautifulSoup's get_text() leaves out (besides comments)
+_NON_TEXT_TAGS = frozenset(("script", "style", "template"))
+
+
+def _element_text(el) -> str:
+    """lxml equivalent of BeautifulSoup get_text(separator=" ", strip=True)."""
+    parts = []
+
+    def walk(node):
+        if isinstance(node.tag, str) and node.tag not in _NON_TEXT_TAGS:
+            parts.append(node.text)
+            for child in node:
+                walk(child)
+                parts.append(child.tail)
+
+    walk(el)
+    return " ".join(p.strip() for p in parts if p and p.strip())
+
+
+def _abstract_from_tree(doc) -> Optional[str]:
+    """Same lookup order as fetch_full_abstract's BeautifulSoup path."""
+    first = {}
+    for el in _ABSTRACT_XPATH(doc):
+        first.setdefault(el.tag, el)
+
+    if "div" in first:
+        return _element_text(first["div"])
+    if "section" in first:
+        content = _SECTION_CONTENT_XPATH(first["section"])
+        if content:
+            return _element_text(content[0])
+    meta = first.get("meta")
+    if meta is not None and meta.get("content"):
+        return meta.get("content")
+    return None
+
+
+def fetch_full_abstract(url: str, session: requests.Session) -> Optional[str]:
+    """Fetch the full abstract from a Nature article page.
+
+    Nature publicly displays abstracts even for paywalled articles.
+    With lxml installed the page is walked once by XPath instead of a
+    chain of soup.find() calls.
+    """
+    try:
+        if lxml_html is not None:
+            doc = fetch_tree(url, session)
+            return _abstract_from_tree(doc) if doc is not None else None
+
+        soup = fetch_page(url, session)
+        if not soup:
+            return None
+
+        # Primary: structured abstract div
+        abs_div = soup.find("div", id="Abs1-content")
+        if abs_div:
+            return abs_div.get_text(separator=" ", strip=True)
+
+        # Fallback: section with data-title="Abstract"
+        abs_section = soup.find("section", attrs={"data-title": "Abstract"})
+        if abs_section:
+            content = abs_section.find("div", class_="c-article-section__content")
+            if content:
+                return content.get_text(separator=" ", strip=True)
+
+        # Last resort: meta description
+        meta = soup.find("meta", attrs={"name": "description"})
+        if meta and meta.get("content"):
+            return meta["content"]
+
+        return None
+    except Exception as e:
+        print(f"  ⚠ Abstract fetch failed for {url}: {e}", file=sys.stderr)
+        return None
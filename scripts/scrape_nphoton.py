@@ -14,23 +14,59 @@ Output:
     - articles_raw.yaml    : structured metadata for all articles
     - editorials.yaml      : editorial metadata + DOIs for manual download
     - trend_report.md      : compressed trend analysis (< 5000 tokens)
+    (--format json writes articles_raw.json instead; --compress gzips both data files)
 """
 
 import json
 
 import argparse
+import gzip
+import heapq
 import os
 import re
 import sys
 import time
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 import requests
 import yaml
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from nature_pages import (
+    HTML_PARSER,
+    fetch_full_abstract,
+    fetch_page,
+    is_cached,
+    spaced,
+)
+
+try:
+    import ahocorasick  # optional (pyahocorasick): one-pass keyword matching
+except ImportError:
+    ahocorasick = None
+
+try:
+    import requests_cache  # optional: persistent page cache between runs
+except ImportError:
+    requests_cache = None
+
+try:
+    import orjson  # optional: fast JSON encoding for --format json
+except ImportError:
+    orjson = None
+
+try:
+    from yaml import CSafeDumper as _YamlDumper  # libyaml-backed
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -58,14 +94,21 @@ HEADERS = {
     "Accept-Language": "en-US,en;q=0.9",
 }
 RATE_LIMIT_SECONDS = 2.0
+FETCH_WORKERS = 4  # concurrent page fetches; request starts stay rate-limited
+PAGE_CACHE_DAYS = 7
+GZIP_LEVEL = 6  # --compress output; balances size against write time
 SEMANTIC_SCHOLAR_API = "https://api.semanticscholar.org/graph/v1/paper"
+SEMANTIC_SCHOLAR_BATCH_API = "https://api.semanticscholar.org/graph/v1/paper/batch"
+S2_BATCH_SIZE = 500  # max IDs per batch request
+S2_RATE_LIMIT_SECONDS = 3.0  # between per-DOI request starts (~100 req / 5 min)
+S2_BACKOFF_SECONDS = 30  # hold-off after a 429 from Semantic Scholar
 
 # Nature Photonics: Volume = year - 2006, Issue = month number
 VOLUME_YEAR_OFFSET = 2006
 
 # Fix #3: Broadened editorial-type detection — covers Editorial, Comment, etc.
-EDITORIAL_TYPES = {"editorial", "comment", "world view", "correspondence",
-                   "news feature", "research highlight"}
+EDITORIAL_TYPES = frozenset({"editorial", "comment", "world view", "correspondence",
+                             "news feature", "research highlight"})
 
 # Stopwords for keyword extraction (minimal set for scientific titles)
 STOPWORDS = {
@@ -92,6 +135,28 @@ DEFAULT_STRUCTURAL_NOISE = {
     "correction", "author", "publisher",  # corrigendum noise
 }
 
+# Precompiled patterns (page parsing, keyword extraction, framing classification)
+_DOI_PATH_RE = re.compile(r"/articles/(s\d+[-\w]+)")
+_DATE_CLASS_RE = re.compile(r"date")
+_OA_CLASS_RE = re.compile(r"open-access|oa-label")
+_OA_TEXT_RE = re.compile(r"Open Access", re.I)
+_TITLE_CLASS_RE = re.compile(r"article-title|ArticleTitle")
+_BODY_CLASS_RE = re.compile(r"article-body|body")
+_COMPOUND_RE = re.compile(r'[a-zA-Z]{3,}(?:-[a-zA-Z]{3,})+')
+_WORD_RE = re.compile(r'\b[a-zA-Z][a-zA-Z]{3,}\b')
+_PROBLEM_FIRST_RE = re.compile(
+    r"(The inability|A major challenge|Despite|Although|However|The lack|"
+    r"Limitations|The difficulty|Current|Existing|Challenges|While)", re.I)
+_RESULT_FIRST_RE = re.compile(
+    r"(We demonstrate|We show|We report|We present|We develop|We achieve)", re.I)
+_PASSIVE_RE = re.compile(
+    r"(is|are|was|were)\s+(demonstrated|reported|shown|achieved|realized|presented|enabled|obtained)", re.I)
+_METHOD_FIRST_RE = re.compile(r"(By |Using |Through |Via |Combining )", re.I)
+_VISION_FIRST_RE = re.compile(r"(\w+\s+(promises|offers|allows|paves|opens))", re.I)
+_SENT_END_RE = re.compile(r'[.!]')
+_FUTURE_SIGNAL_RE = re.compile(
+    r'(future|potential|promise|paving|toward|prospect|outlook|could\s+lead|will\s+allow)', re.I)
+
 
 # ---------------------------------------------------------------------------
 # URL Generation
@@ -134,19 +199,46 @@ def generate_issue_urls(journal: str, months: int, ref_date: datetime = None):
 
 
 # ---------------------------------------------------------------------------
-# TOC Scraping
+# HTTP Session
 # ---------------------------------------------------------------------------
-def fetch_page(url: str, session: requests.Session) -> Optional[BeautifulSoup]:
-    """Fetch a page and return parsed BeautifulSoup, or None on failure."""
-    try:
-        resp = session.get(url, headers=HEADERS, timeout=30)
-        resp.raise_for_status()
-        return BeautifulSoup(resp.text, "html.parser")
-    except requests.RequestException as e:
-        print(f"  ⚠ Failed to fetch {url}: {e}", file=sys.stderr)
-        return None
+def make_session(cache_path: Optional[Path] = None, refresh: bool = False) -> requests.Session:
+    """Session shared by all fetches: browser headers, keep-alive pool, retries.
+
+    Transient failures (429/5xx) are retried with exponential backoff; after the
+    last retry the final response is returned, so callers still see its status.
+    With cache_path (and requests_cache installed), TOC and article pages are
+    kept in a SQLite cache for PAGE_CACHE_DAYS; Semantic Scholar is never cached.
+    refresh drops everything cached so far.
+    """
+    if cache_path is None or requests_cache is None:
+        session = requests.Session()
+    else:
+        session = requests_cache.CachedSession(
+            str(cache_path), backend="sqlite",
+            expire_after=timedelta(days=PAGE_CACHE_DAYS),
+            urls_expire_after={SEMANTIC_SCHOLAR_API.split("://", 1)[-1]: requests_cache.DO_NOT_CACHE},
+            allowable_codes=(200,), stale_if_error=True,
+        )
+        if refresh:
+            session.cache.clear()
+        else:
+            session.cache.delete(expired=True)  # so is_cached() only sees live entries
+    session.headers.update(HEADERS)
+    retry = Retry(
+        total=3, backoff_factor=1.0,
+        status_forcelist=(429, 500, 502, 503, 504), raise_on_status=False,
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"},  # S2 batch lookups are reads
+    )
+    # One pool per host (nature.com, Semantic Scholar), one socket per worker
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=FETCH_WORKERS, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
+# ---------------------------------------------------------------------------
+# TOC Scraping
+# ---------------------------------------------------------------------------
 def extract_articles_from_toc(soup: BeautifulSoup, issue_meta: dict) -> list[dict]:
     """Extract article metadata from a TOC page."""
     articles = []
@@ -172,7 +264,7 @@ def extract_articles_from_toc(soup: BeautifulSoup, issue_meta: dict) -> list[dic
         entry["url"] = BASE_URL + href if href.startswith("/") else href
         
         # DOI (extract from URL: /articles/s41566-... → 10.1038/s41566-...)
-        doi_match = re.search(r"/articles/(s\d+[-\w]+)", href)
+        doi_match = _DOI_PATH_RE.search(href)
         if doi_match:
             entry["doi"] = f"10.1038/{doi_match.group(1)}"
         
@@ -197,13 +289,13 @@ def extract_articles_from_toc(soup: BeautifulSoup, issue_meta: dict) -> list[dic
         if date_tag:
             entry["date"] = date_tag.get("datetime", date_tag.get_text(strip=True))
         else:
-            date_span = tag.find("span", class_=re.compile(r"date"))
+            date_span = tag.find("span", class_=_DATE_CLASS_RE)
             entry["date"] = date_span.get_text(strip=True) if date_span else ""
         
         # Open Access?
-        oa_tag = tag.find("span", class_=re.compile(r"open-access|oa-label"))
+        oa_tag = tag.find("span", class_=_OA_CLASS_RE)
         if not oa_tag:
-            oa_tag = tag.find("span", string=re.compile(r"Open Access", re.I))
+            oa_tag = tag.find("span", string=_OA_TEXT_RE)
         entry["open_access"] = bool(oa_tag)
         
         # Issue metadata
@@ -229,13 +321,13 @@ def extract_editorial_public(article_url: str, session: requests.Session) -> dic
     result = {}
     
     # Title
-    h1 = soup.find("h1", class_=re.compile(r"article-title|ArticleTitle"))
+    h1 = soup.find("h1", class_=_TITLE_CLASS_RE)
     if not h1:
         h1 = soup.find("h1")
     result["title"] = h1.get_text(strip=True) if h1 else ""
     
     # First paragraph (usually visible even behind paywall)
-    body = soup.find("div", class_=re.compile(r"article-body|body"))
+    body = soup.find("div", class_=_BODY_CLASS_RE)
     if body:
         first_p = body.find("p")
         result["first_paragraph"] = first_p.get_text(strip=True) if first_p else ""
@@ -268,7 +360,7 @@ def read_local_editorials(directory: str) -> list[dict]:
             content = f.read_text(encoding="utf-8", errors="replace")
             
             if f.suffix == ".html":
-                soup = BeautifulSoup(content, "html.parser")
+                soup = BeautifulSoup(content, HTML_PARSER)
                 text = soup.get_text(separator="\n", strip=True)
             else:
                 text = content
@@ -292,14 +384,16 @@ def extract_keywords_from_text(text: str) -> list[str]:
     Preserves hyphenated compounds (e.g. 'light-emitting', 'tip-enhanced').
     Minimum 4 characters to avoid fragment noise ('tin', 'per', 'mit', 'gan').
     """
+    low = text.lower()
     # First extract hyphenated compounds as single tokens
-    compounds = re.findall(r'[a-zA-Z]{3,}(?:-[a-zA-Z]{3,})+', text.lower())
+    compounds = _COMPOUND_RE.findall(low)
     # Then extract single words (≥4 chars, letter-bounded)
-    words = re.findall(r'\b[a-zA-Z][a-zA-Z]{3,}\b', text.lower())
+    words = _WORD_RE.findall(low)
     tokens = compounds + [w for w in words if w not in STOPWORDS and len(w) >= 4]
     return tokens
 
 
+@lru_cache(maxsize=4096)  # pure in snippet; N&V blurbs and corrigenda repeat
 def classify_framing(snippet: str) -> str:
     """Fix #2: Expanded framing pattern classification.
     
@@ -311,45 +405,37 @@ def classify_framing(snippet: str) -> str:
     first_sentence = snippet.split(".")[0].strip() if "." in snippet else snippet
     
     # Problem-first: opens with a challenge or gap
-    if re.match(
-        r"(The inability|A major challenge|Despite|Although|However|The lack|"
-        r"Limitations|The difficulty|Current|Existing|Challenges|While)",
-        first_sentence, re.I,
-    ):
+    if _PROBLEM_FIRST_RE.match(first_sentence):
         return "problem-first"
     
     # Result-first (first person): "We demonstrate / show / report..."
-    if re.match(
-        r"(We demonstrate|We show|We report|We present|We develop|We achieve)",
-        first_sentence, re.I,
-    ):
+    if _RESULT_FIRST_RE.match(first_sentence):
         return "result-first"
     
     # Passive-demonstrated: "...is demonstrated / are reported / is achieved"
-    if re.search(
-        r"(is|are|was|were)\s+(demonstrated|reported|shown|achieved|realized|presented|enabled|obtained)",
-        first_sentence, re.I,
-    ):
+    if _PASSIVE_RE.search(first_sentence):
         return "passive-demonstrated"
     
     # Method-first: "By combining / Using / Through"
-    if re.match(
-        r"(By |Using |Through |Via |Combining )",
-        first_sentence, re.I,
-    ):
+    if _METHOD_FIRST_RE.match(first_sentence):
         return "method-first"
     
     # Vision-first: "X promises / offers"
-    if re.match(
-        r"(\w+\s+(promises|offers|allows|paves|opens))",
-        first_sentence, re.I,
-    ):
+    if _VISION_FIRST_RE.match(first_sentence):
         return "vision-first"
     
     # FALLBACK: object-first (default for Nature editor snippets)
     return "object-first"
 
 
+def _parse_date(value: str) -> Optional[datetime]:
+    """Parse an ISO date/datetime (trailing 'Z' allowed); None if unparseable."""
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (ValueError, TypeError):
+        return None
+
+
 def analyze_trends(
     articles: list[dict],
     user_keywords: list[str] = None,
@@ -362,27 +448,22 @@ def analyze_trends(
     in Nature Photonics).
     """
     noise = exclude_keywords or set()
-    keyword_counter = Counter()
     type_counter = Counter()
     opening_patterns = Counter()
     
-    # Separate by half-period for trend detection
+    # Separate by half-period for trend detection (dates parsed once, reused below)
+    article_dates = [_parse_date(a.get("date", "")) for a in articles]
     mid_date = datetime.now()
-    if articles:
-        dates = []
-        for a in articles:
-            try:
-                d = datetime.fromisoformat(a.get("date", "").replace("Z", "+00:00"))
-                dates.append(d)
-            except (ValueError, TypeError):
-                pass
-        if dates:
-            mid_date = min(dates) + (max(dates) - min(dates)) / 2
+    dates = [d for d in article_dates if d is not None]
+    if dates:
+        mid_date = min(dates) + (max(dates) - min(dates)) / 2
     
-    recent_keywords = Counter()
-    older_keywords = Counter()
+    # Per-article keyword lists, counted in one Counter pass each after the loop
+    article_kws = []
+    recent_kws = []
+    older_kws = []
     
-    for article in articles:
+    for article, d in zip(articles, article_dates):
         # Article type distribution
         atype = article.get("article_type", "Article")
         type_counter[atype] += 1
@@ -390,17 +471,14 @@ def analyze_trends(
         # Keywords from title + abstract
         text = article.get("title", "") + " " + article.get("abstract_snippet", "")
         kws = extract_keywords_from_text(text)
-        keyword_counter.update(kws)
+        article_kws.append(kws)
         
-        # Trend detection: recent vs older
-        try:
-            d = datetime.fromisoformat(article.get("date", "").replace("Z", "+00:00"))
-            if d > mid_date:
-                recent_keywords.update(kws)
-            else:
-                older_keywords.update(kws)
-        except (ValueError, TypeError):
-            pass
+        # Trend detection: recent vs older (naive vs aware dates don't compare)
+        if d is not None:
+            try:
+                (recent_kws if d > mid_date else older_kws).append(kws)
+            except TypeError:
+                pass
         
         # Fix #2: Expanded framing classification
         snippet = article.get("abstract_snippet", "")
@@ -408,15 +486,19 @@ def analyze_trends(
         if pattern:
             opening_patterns[pattern] += 1
     
+    keyword_counter = Counter(chain.from_iterable(article_kws))
+    recent_keywords = Counter(chain.from_iterable(recent_kws))
+    older_keywords = Counter(chain.from_iterable(older_kws))
+    
     # Trend scoring: rising vs declining
     # Fix #1: filter out structural noise from trending
+    # Counter subscripts return 0 for missing keys, so no .get() is needed
     trending = {}
-    all_kws = set(recent_keywords.keys()) | set(older_keywords.keys())
-    for kw in all_kws:
+    for kw in recent_keywords + older_keywords:
         if kw in noise:
             continue
-        r = recent_keywords.get(kw, 0)
-        o = older_keywords.get(kw, 0)
+        r = recent_keywords[kw]
+        o = older_keywords[kw]
         if o == 0 and r > 0:
             trend = "▴ new"
         elif r > o * 1.3:
@@ -485,8 +567,10 @@ def generate_trend_report(
         lines.append("")
         lines.append("| Date | Title | Type |")
         lines.append("|:--|:--|:--|")
-        for ea in editorial_articles:
-            lines.append(f"| {ea.get('date', 'N/A')} | {ea.get('title', 'N/A')} | {ea.get('article_type', 'Editorial')} |")
+        lines.extend(
+            f"| {ea.get('date', 'N/A')} | {ea.get('title', 'N/A')} | {ea.get('article_type', 'Editorial')} |"
+            for ea in editorial_articles
+        )
         lines.append("")
         
         # If we have full-text editorials (local or scraped)
@@ -510,12 +594,13 @@ def generate_trend_report(
     lines.append("|:--|:--|:--|:--|")
     
     trending = analysis.get("trending", {})
-    top_kws = sorted(trending.items(), key=lambda x: x[1]["total"], reverse=True)[:20]
+    top_kws = heapq.nlargest(20, trending.items(), key=lambda x: x[1]["total"])
     user_kw_set = {k.lower().strip() for k in (user_keywords or [])}
     
-    for kw, info in top_kws:
-        in_ms = "✅" if kw in user_kw_set else ""
-        lines.append(f"| {kw} | {info['total']} | {info['trend']} | {in_ms} |")
+    lines.extend(
+        f"| {kw} | {info['total']} | {info['trend']} | {'✅' if kw in user_kw_set else ''} |"
+        for kw, info in top_kws
+    )
     
     lines.append("")
     
@@ -523,8 +608,7 @@ def generate_trend_report(
     if analysis.get("user_keyword_status"):
         lines.append("### Your Keywords vs Trend")
         lines.append("")
-        for kw, status in analysis["user_keyword_status"].items():
-            lines.append(f"- **{kw}**: {status}")
+        lines.extend(f"- **{kw}**: {status}" for kw, status in analysis["user_keyword_status"].items())
         lines.append("")
     
     # Section 3: Framing patterns
@@ -532,22 +616,25 @@ def generate_trend_report(
     lines.append("")
     op = analysis.get("opening_patterns", {})
     total_op = sum(op.values()) or 1
-    for pattern, count in sorted(op.items(), key=lambda x: -x[1]):
-        pct = int(100 * count / total_op)
-        lines.append(f"- **{pattern}**: {count} ({pct}%)")
+    lines.extend(
+        f"- **{pattern}**: {count} ({int(100 * count / total_op)}%)"
+        for pattern, count in sorted(op.items(), key=lambda x: -x[1])
+    )
     lines.append("")
     
     # Section 4: Article type distribution
     lines.append("## 4. Article Type Distribution")
     lines.append("")
-    for atype, count in sorted(analysis.get("type_distribution", {}).items(), key=lambda x: -x[1]):
-        lines.append(f"- {atype}: {count}")
+    lines.extend(
+        f"- {atype}: {count}"
+        for atype, count in sorted(analysis.get("type_distribution", {}).items(), key=lambda x: -x[1])
+    )
     lines.append("")
     
     # Section 5: Editorial DOIs for manual download
+    have_titles = {e.get("title") for e in editorials}
     editorials_needing_download = [
-        a for a in editorial_articles
-        if not any(e.get("title") == a.get("title") for e in editorials)
+        a for a in editorial_articles if a.get("title") not in have_titles
     ]
     if editorials_needing_download:
         lines.append("## 5. Editorials — Manual Download Needed")
@@ -557,10 +644,10 @@ def generate_trend_report(
         lines.append("")
         lines.append("| Title | DOI | URL |")
         lines.append("|:--|:--|:--|")
-        for ea in editorials_needing_download:
-            doi = ea.get("doi", "N/A")
-            url = ea.get("url", "N/A")
-            lines.append(f"| {ea.get('title', 'N/A')} | {doi} | [link]({url}) |")
+        lines.extend(
+            f"| {ea.get('title', 'N/A')} | {ea.get('doi', 'N/A')} | [link]({ea.get('url', 'N/A')}) |"
+            for ea in editorials_needing_download
+        )
         lines.append("")
     
     # Section 6: News & Views Analysis (Fix #4)
@@ -585,22 +672,21 @@ def generate_trend_report(
         future_signals = []
         for nv in nv_articles:
             snippet = nv.get("abstract_snippet", "")
-            for sent in re.split(r'[.!]', snippet):
+            for sent in _SENT_END_RE.split(snippet):
                 sent = sent.strip()
-                if re.search(r'(future|potential|promise|paving|toward|prospect|outlook|could\s+lead|will\s+allow)', sent, re.I) and len(sent) > 20:
+                if _FUTURE_SIGNAL_RE.search(sent) and len(sent) > 20:
                     future_signals.append((nv.get("title", ""), sent))
         
         if future_signals:
             lines.append("### N&V Future Directions")
             lines.append("")
-            for title, signal in future_signals:
-                lines.append(f"- **{title}**: \"{signal}\"")
+            lines.extend(f"- **{title}**: \"{signal}\"" for title, signal in future_signals)
             lines.append("")
     
     # Section 7: Most Relevant Articles (if relevance scores available)
     relevant = [a for a in articles if a.get("relevance_score", 0) > 0]
     if relevant:
-        relevant_sorted = sorted(relevant, key=lambda x: x.get("relevance_score", 0), reverse=True)[:15]
+        relevant_sorted = heapq.nlargest(15, relevant, key=lambda x: x.get("relevance_score", 0))
         lines.append("## 7. Most Relevant to Your Research")
         lines.append("")
         lines.append("> Ranked by keyword overlap with your `--keywords`.")
@@ -630,7 +716,7 @@ def generate_trend_report(
         lines.append("")
         lines.append("| Title | Citations | Key References |")
         lines.append("|:--|:--|:--|")
-        for a in sorted(cited_articles, key=lambda x: x.get("citation_count", 0), reverse=True)[:10]:
+        for a in heapq.nlargest(10, cited_articles, key=lambda x: x.get("citation_count", 0)):
             refs = a.get("top_references", [])
             ref_str = "; ".join(refs[:3]) if refs else "—"
             lines.append(f"| {a.get('title', 'N/A')} | {a.get('citation_count', 0)} | {ref_str} |")
@@ -641,25 +727,32 @@ def generate_trend_report(
         niche_kws = []
         user_kw_lower = {k.lower().strip() for k in user_keywords}
         trending = analysis.get("trending", {})
+        # Only articles that mention a manuscript keyword can co-occur; find
+        # them once rather than re-lowering every article for every keyword.
+        user_texts = [
+            text for text in (
+                (a.get("title", "") + " " + a.get("abstract_snippet", "")).lower()
+                for a in articles
+            )
+            if any(uk in text for uk in user_kw_lower)
+        ]
         for kw, info in trending.items():
-            cooccur = 0
-            for a in articles:
-                text = (a.get("title", "") + " " + a.get("abstract_snippet", "")).lower()
-                if kw in text and any(uk in text for uk in user_kw_lower):
-                    cooccur += 1
+            cooccur = sum(1 for text in user_texts if kw in text)
             if cooccur > 0:
                 niche_kws.append((kw, info["total"], info["trend"], cooccur))
         
         if niche_kws:
-            niche_kws.sort(key=lambda x: x[3], reverse=True)
+            niche_kws = heapq.nlargest(15, niche_kws, key=lambda x: x[3])
             lines.append("## 9. Niche-Relevant Keywords")
             lines.append("")
             lines.append("> Keywords that co-occur with your manuscript keywords in the same article.")
             lines.append("")
             lines.append("| Keyword | Total | Trend | Co-occurrence |")
             lines.append("|:--|:--|:--|:--|")
-            for kw, total, trend, cooccur in niche_kws[:15]:
-                lines.append(f"| {kw} | {total} | {trend} | {cooccur} |")
+            lines.extend(
+                f"| {kw} | {total} | {trend} | {cooccur} |"
+                for kw, total, trend, cooccur in niche_kws
+            )
             lines.append("")
     
     # Section 11: Seed Citation Network
@@ -677,16 +770,20 @@ def generate_trend_report(
                 lines.append("")
                 lines.append("| Title | Year | Venue |")
                 lines.append("|:--|:--|:--|")
-                for c in seed['top_citing']:
-                    lines.append(f"| {c['title']} | {c.get('year', '')} | {c.get('venue', '')} |")
+                lines.extend(
+                    f"| {c['title']} | {c.get('year', '')} | {c.get('venue', '')} |"
+                    for c in seed['top_citing']
+                )
                 lines.append("")
             if seed.get('key_references'):
                 lines.append("**Key References** (what this work builds on):")
                 lines.append("")
                 lines.append("| Title | Year | Venue |")
                 lines.append("|:--|:--|:--|")
-                for r in seed['key_references']:
-                    lines.append(f"| {r['title']} | {r.get('year', '')} | {r.get('venue', '')} |")
+                lines.extend(
+                    f"| {r['title']} | {r.get('year', '')} | {r.get('venue', '')} |"
+                    for r in seed['key_references']
+                )
                 lines.append("")
     
     # Section 12: Cross-Journal Results
@@ -697,8 +794,10 @@ def generate_trend_report(
         lines.append("")
         lines.append("| Title | Journal | Date |")
         lines.append("|:--|:--|:--|")
-        for r in cross_journal_results:
-            lines.append(f"| {r.get('title', 'N/A')} | {r.get('journal', 'N/A')} | {r.get('date', '')} |")
+        lines.extend(
+            f"| {r.get('title', 'N/A')} | {r.get('journal', 'N/A')} | {r.get('date', '')} |"
+            for r in cross_journal_results
+        )
         lines.append("")
     
     # Section 13: Full Article List
@@ -706,8 +805,10 @@ def generate_trend_report(
     lines.append("")
     lines.append("| # | Title | Type | Date |")
     lines.append("|:--|:--|:--|:--|")
-    for i, a in enumerate(articles, 1):
-        lines.append(f"| {i} | {a.get('title', 'N/A')} | {a.get('article_type', 'N/A')} | {a.get('date', 'N/A')} |")
+    lines.extend(
+        f"| {i} | {a.get('title', 'N/A')} | {a.get('article_type', 'N/A')} | {a.get('date', 'N/A')} |"
+        for i, a in enumerate(articles, 1)
+    )
     lines.append("")
     
     report_text = "\n".join(lines)
@@ -720,58 +821,48 @@ def generate_trend_report(
 
 
 # ---------------------------------------------------------------------------
-# Full Abstract Fetcher
+# Relevance Scoring
 # ---------------------------------------------------------------------------
-def fetch_full_abstract(url: str, session: requests.Session) -> Optional[str]:
-    """Fetch the full abstract from a Nature article page.
+def keyword_matcher(keywords: list) -> Callable[[str], Set[str]]:
+    """Return match(text) -> the normalized (lowercased, stripped) keywords found in text.
     
-    Nature publicly displays abstracts even for paywalled articles.
+    With pyahocorasick the text is scanned once for all keywords; otherwise
+    each keyword is a substring test. Both give the same set.
     """
-    try:
-        soup = fetch_page(url, session)
-        if not soup:
-            return None
-        
-        # Primary: structured abstract div
-        abs_div = soup.find("div", id="Abs1-content")
-        if abs_div:
-            return abs_div.get_text(separator=" ", strip=True)
-        
-        # Fallback: section with data-title="Abstract"
-        abs_section = soup.find("section", attrs={"data-title": "Abstract"})
-        if abs_section:
-            content = abs_section.find("div", class_="c-article-section__content")
-            if content:
-                return content.get_text(separator=" ", strip=True)
-        
-        # Last resort: meta description
-        meta = soup.find("meta", attrs={"name": "description"})
-        if meta and meta.get("content"):
-            return meta["content"]
-        
-        return None
-    except Exception as e:
-        print(f"  ⚠ Abstract fetch failed for {url}: {e}", file=sys.stderr)
-        return None
+    needles = {kw.lower().strip() for kw in keywords}
+    if ahocorasick is None or not needles or "" in needles:  # '' can't be added
+        return lambda text: {kw for kw in needles if kw in text}
+    automaton = ahocorasick.Automaton()
+    for kw in needles:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return lambda text: {kw for _, kw in automaton.iter(text)}
 
 
-# ---------------------------------------------------------------------------
-# Relevance Scoring
-# ---------------------------------------------------------------------------
-def compute_relevance_score(article: dict, user_keywords: list) -> int:
-    """Score article relevance: +2 for keyword in title, +1 for keyword in snippet."""
-    if not user_keywords:
+def compute_relevance_score(
+    article: dict,
+    norm_keywords: list,
+    matcher: Optional[Callable[[str], Set[str]]] = None,
+) -> int:
+    """Score article relevance: +2 for keyword in title, +1 for keyword in snippet.
+    
+    norm_keywords are already lowercased and stripped (normalized once by the
+    caller, not per article). Pass matcher=keyword_matcher(norm_keywords) when
+    scoring many articles.
+    """
+    if not norm_keywords:
         return 0
+    if matcher is None:
+        matcher = keyword_matcher(norm_keywords)
     
-    title = article.get("title", "").lower()
-    snippet = article.get("abstract_snippet", "").lower()
+    in_title = matcher(article.get("title", "").lower())
+    in_snippet = matcher(article.get("abstract_snippet", "").lower())
     score = 0
     
-    for kw in user_keywords:
-        kw_lower = kw.lower().strip()
-        if kw_lower in title:
+    for kw in norm_keywords:
+        if kw in in_title:
             score += 2
-        if kw_lower in snippet:
+        if kw in in_snippet:
             score += 1
     
     return score
@@ -780,40 +871,91 @@ def compute_relevance_score(article: dict, user_keywords: list) -> int:
 # ---------------------------------------------------------------------------
 # Semantic Scholar Citation Context
 # ---------------------------------------------------------------------------
-def fetch_citation_context(doi: str, session: requests.Session) -> Optional[dict]:
-    """Query Semantic Scholar API for citation count and key references.
+_CITATION_FIELDS = "title,citationCount,references.title"
+
+
+def _citation_context(data: dict) -> dict:
+    """Citation count + first five reference titles from a Semantic Scholar paper."""
+    refs = data.get("references", []) or []
+    return {
+        "citation_count": data.get("citationCount", 0),
+        "top_references": [r["title"] for r in refs[:5] if r.get("title")],
+    }
+
+
+def fetch_citation_contexts(dois: List[str], session: requests.Session) -> Dict[str, dict]:
+    """Query Semantic Scholar for citation counts and key references of many DOIs.
     
+    Uses the paper/batch endpoint: one POST per S2_BATCH_SIZE DOIs instead of
+    one GET each. Returns {doi: context} for the papers Semantic Scholar knows.
     Free API, no key needed, rate limit ~100 req/5 min.
     """
-    if not doi:
-        return None
-    
+    contexts = {}
+    unique = list(dict.fromkeys(d for d in dois if d))
+    for start in range(0, len(unique), S2_BATCH_SIZE):
+        chunk = unique[start:start + S2_BATCH_SIZE]
+
+        def post_chunk():
+            return session.post(
+                SEMANTIC_SCHOLAR_BATCH_API,
+                params={"fields": _CITATION_FIELDS},
+                json={"ids": [f"DOI:{d}" for d in chunk]},
+                timeout=30,
+            )
+
+        try:
+            resp = post_chunk()
+            if resp.status_code == 429:
+                # Still limited after the adapter's retries: wait it out, try once more
+                print(f"  ⚠ Semantic Scholar rate limit hit. Pausing {S2_BACKOFF_SECONDS}s before retrying...",
+                      file=sys.stderr)
+                time.sleep(S2_BACKOFF_SECONDS)
+                resp = post_chunk()
+            if resp.status_code == 200:
+                # Results come back in request order, null for unknown IDs
+                for doi, data in zip(chunk, resp.json()):
+                    if data:
+                        contexts[doi] = _citation_context(data)
+            elif resp.status_code == 400:
+                # One malformed ID rejects the whole batch; look them up singly
+                print(f"  ⚠ Semantic Scholar rejected the batch; querying {len(chunk)} DOIs one by one", file=sys.stderr)
+                for j, doi in enumerate(chunk):
+                    if j:
+                        time.sleep(S2_RATE_LIMIT_SECONDS)
+                    ctx = fetch_citation_context(doi, session)
+                    if ctx:
+                        contexts[doi] = ctx
+            else:
+                print(f"  ⚠ Semantic Scholar returned {resp.status_code}; "
+                      f"citation context skipped for {len(chunk)} DOIs", file=sys.stderr)
+        except Exception as e:
+            print(f"  ⚠ Semantic Scholar batch query failed ({len(chunk)} DOIs): {e}", file=sys.stderr)
+    return contexts
+
+
+def fetch_citation_context(doi: str, session: requests.Session) -> Optional[dict]:
+    """Single-DOI fallback for fetch_citation_contexts (GET paper/DOI:...)."""
     try:
-        url = f"{SEMANTIC_SCHOLAR_API}/DOI:{doi}?fields=title,citationCount,references.title"
-        resp = session.get(url, timeout=15)
-        if resp.status_code == 200:
-            data = resp.json()
-            refs = data.get("references", []) or []
-            return {
-                "citation_count": data.get("citationCount", 0),
-                "top_references": [r["title"] for r in refs[:5] if r.get("title")],
-            }
-        elif resp.status_code == 429:
-            print("  ⚠ Semantic Scholar rate limit hit. Pausing 30s...", file=sys.stderr)
-            time.sleep(30)
-            return None
-        else:
-            return None
+        resp = session.get(f"{SEMANTIC_SCHOLAR_API}/DOI:{doi}",
+                           params={"fields": _CITATION_FIELDS}, timeout=15)
+        return _citation_context(resp.json()) if resp.status_code == 200 else None
     except Exception as e:
         print(f"  ⚠ Semantic Scholar query failed for {doi}: {e}", file=sys.stderr)
         return None
 
 
-def fetch_seed_citation_network(doi: str, session: requests.Session) -> Optional[dict]:
+def fetch_seed_citation_network(
+    doi: str,
+    session: requests.Session,
+    backoff: Optional[Callable[[float], None]] = None,
+) -> Optional[dict]:
     """Fetch full citation network for a benchmark (seed) DOI.
     
     Returns the paper's title, citation count, top citing papers, and references.
     Used with --seed-dois to map your competitive landscape.
+    On a 429, backoff(seconds) is called (the shared limiter's pause) so every
+    worker holds off, and the lookup is retried once after the pause. If it is
+    still rate-limited, returns {"doi": doi, "rate_limited": True}.
     """
     if not doi:
         return None
@@ -825,14 +967,20 @@ def fetch_seed_citation_network(doi: str, session: requests.Session) -> Optional
                f"citations.title,citations.year,citations.venue,citations.citationCount,"
                f"references.title,references.year,references.venue")
         resp = session.get(url, timeout=20)
+        if resp.status_code == 429:
+            print(f"  ⚠ Rate limit hit. Pausing {S2_BACKOFF_SECONDS}s before retrying {doi}...", file=sys.stderr)
+            if backoff:
+                backoff(S2_BACKOFF_SECONDS)
+            time.sleep(S2_BACKOFF_SECONDS)
+            resp = session.get(url, timeout=20)
         if resp.status_code == 200:
             data = resp.json()
             citations = data.get("citations", []) or []
             references = data.get("references", []) or []
             # Sort citing papers by their own citation count (most impactful first)
-            citations_sorted = sorted(
-                [c for c in citations if c.get("title")],
-                key=lambda x: x.get("citationCount", 0), reverse=True
+            citations_sorted = heapq.nlargest(
+                10, (c for c in citations if c.get("title")),
+                key=lambda x: x.get("citationCount", 0),
             )
             return {
                 "title": data.get("title", ""),
@@ -841,7 +989,7 @@ def fetch_seed_citation_network(doi: str, session: requests.Session) -> Optional
                 "citation_count": data.get("citationCount", 0),
                 "top_citing": [
                     {"title": c["title"], "year": c.get("year"), "venue": c.get("venue", "")}
-                    for c in citations_sorted[:10]
+                    for c in citations_sorted
                 ],
                 "key_references": [
                     {"title": r["title"], "year": r.get("year"), "venue": r.get("venue", "")}
@@ -849,9 +997,7 @@ def fetch_seed_citation_network(doi: str, session: requests.Session) -> Optional
                 ],
             }
         elif resp.status_code == 429:
-            print("  ⚠ Rate limit hit. Pausing 30s...", file=sys.stderr)
-            time.sleep(30)
-            return None
+            return {"doi": doi, "rate_limited": True}
         else:
             return None
     except Exception as e:
@@ -865,33 +1011,38 @@ def fetch_seed_citation_network(doi: str, session: requests.Session) -> Optional
 def search_nature_keywords(
     keywords: list[str],
     journals: list[str],
-    session: requests.Session,
+    fetch: Callable[[str], Optional[BeautifulSoup]],
     max_results: int = 20,
 ) -> list[dict]:
     """Search nature.com across multiple journals for keyword-matching articles.
     
     Uses the nature.com search page to find recent articles matching
     user keywords in specified journals (e.g. ACS Nano via nature search,
-    Nano Letters, Optica, etc.).
+    Nano Letters, Optica, etc.). fetch(url) loads each search page; main()
+    passes its rate-limited, cache-aware fetch_page.
     """
     results = []
+    seen_urls = set()  # an article can surface in more than one search
     query = " OR ".join(f'"{kw}"' for kw in keywords[:5])  # top 5 keywords as query
+    # One search per distinct journal: each keeps its own top max_results
+    journals = list(dict.fromkeys(journals))
     
     for journal_filter in journals:
         try:
             # Nature.com search supports journal filtering
             search_url = (f"{BASE_URL}/search?q={query}"
                          f"&journal={journal_filter}&order=relevance&date_range=last_1_year")
-            soup = fetch_page(search_url, session)
+            soup = fetch(search_url)
             if not soup:
                 continue
             
             # Parse search results
-            items = soup.find_all("article", class_="c-card")
+            # limit= stops the tree walk once enough cards are found
+            items = soup.find_all("article", class_="c-card", limit=max_results)
             if not items:
-                items = soup.find_all("li", class_="app-article-list-row__item")
+                items = soup.find_all("li", class_="app-article-list-row__item", limit=max_results)
             
-            for item in items[:max_results]:
+            for item in items:
                 title_tag = item.find(["h3", "h2"])
                 if not title_tag:
                     continue
@@ -912,6 +1063,10 @@ def search_nature_keywords(
                     journal_tag = item.find("p", class_="c-card__journal-title")
                 journal_name = journal_tag.get_text(strip=True) if journal_tag else journal_filter
                 
+                if url:
+                    if url in seen_urls:
+                        continue
+                    seen_urls.add(url)
                 results.append({
                     "title": title,
                     "url": url,
@@ -919,14 +1074,31 @@ def search_nature_keywords(
                     "journal": journal_name,
                     "source": "cross-journal-search",
                 })
-            
-            time.sleep(RATE_LIMIT_SECONDS)
         except Exception as e:
             print(f"  ⚠ Cross-journal search failed for {journal_filter}: {e}", file=sys.stderr)
     
     return results
 
 
+# ---------------------------------------------------------------------------
+# Output
+# ---------------------------------------------------------------------------
+def write_data(data, path: Path) -> None:
+    """Dump data to path as JSON (*.json) or YAML, gzip-compressed when path ends in .gz."""
+    if path.suffix == ".gz":
+        f = gzip.open(path, "wt", encoding="utf-8", compresslevel=GZIP_LEVEL)
+    else:
+        f = open(path, "w", encoding="utf-8")
+    with f:
+        if ".json" in path.suffixes:
+            if orjson is not None:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8"))
+            else:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+        else:
+            yaml.dump(data, f, Dumper=_YamlDumper, allow_unicode=True, default_flow_style=False, sort_keys=False)
+
+
 # ---------------------------------------------------------------------------
 # Main Pipeline
 # ---------------------------------------------------------------------------
@@ -982,11 +1154,34 @@ def main():
         "--cross-journal", type=str, default="",
         help="Comma-separated Nature journal codes for cross-journal keyword search (e.g. 'nnano,nmat')"
     )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Do not read or write the on-disk page cache (<output>/.cache)"
+    )
+    parser.add_argument(
+        "--refresh", action="store_true",
+        help="Clear the on-disk page cache before scraping"
+    )
+    parser.add_argument(
+        "--compress", action="store_true",
+        help="Write the article and editorial data files gzip-compressed (*.gz)"
+    )
+    parser.add_argument(
+        "--format", choices=["yaml", "json"], default="yaml",
+        help="Format of the articles_raw data file (default: yaml; editorials.yaml stays YAML)"
+    )
+    parser.add_argument(
+        "--save-raw", action="store_true",
+        help="Also save articles_raw right after scraping, before enrichment (a checkpoint if a later step fails)"
+    )
     
     args = parser.parse_args()
     
     output_dir = Path(args.output)
     output_dir.mkdir(parents=True, exist_ok=True)
+    gz_ext = ".gz" if args.compress else ""
+    articles_path = output_dir / f"articles_raw.{args.format}{gz_ext}"
+    ed_yaml_path = output_dir / f"editorials.yaml{gz_ext}"
     
     user_keywords = [k.strip() for k in args.keywords.split(",") if k.strip()]
     
@@ -995,25 +1190,28 @@ def main():
     if args.exclude:
         exclude_keywords.update(k.strip().lower() for k in args.exclude.split(",") if k.strip())
     
-    print(f"╔══════════════════════════════════════════════════╗")
-    print(f"║  Nature Photonics Trend Scraper v2.0            ║")
-    print(f"╠══════════════════════════════════════════════════╣")
-    print(f"║  Journal:  {args.journal:<37s} ║")
-    print(f"║  Months:   {args.months:<37d} ║")
-    print(f"║  Output:   {str(output_dir):<37s} ║")
+    # Banner is assembled first and written with a single print
+    banner = [
+        "╔══════════════════════════════════════════════════╗",
+        "║  Nature Photonics Trend Scraper v2.0            ║",
+        "╠══════════════════════════════════════════════════╣",
+        f"║  Journal:  {args.journal:<37s} ║",
+        f"║  Months:   {args.months:<37d} ║",
+        f"║  Output:   {str(output_dir):<37s} ║",
+    ]
     if user_keywords:
         kw_str = ", ".join(user_keywords[:5])
-        print(f"║  Keywords: {kw_str:<37s} ║")
+        banner.append(f"║  Keywords: {kw_str:<37s} ║")
     if args.fetch_abstracts:
-        print(f"║  Abstracts: top {args.fetch_abstracts:<32d} ║")
+        banner.append(f"║  Abstracts: top {args.fetch_abstracts:<32d} ║")
     if args.citation_context:
-        print(f"║  Citations: Semantic Scholar          ║")
+        banner.append("║  Citations: Semantic Scholar          ║")
     if args.seed_dois:
-        print(f"║  Seed DOIs: {len(args.seed_dois.split(',')):<36d} ║")
+        banner.append(f"║  Seed DOIs: {len(args.seed_dois.split(',')):<36d} ║")
     if args.cross_journal:
-        print(f"║  Cross-J:   {args.cross_journal:<36s} ║")
-    print(f"╚══════════════════════════════════════════════════╝")
-    print()
+        banner.append(f"║  Cross-J:   {args.cross_journal:<36s} ║")
+    banner.append("╚══════════════════════════════════════════════════╝")
+    print("\n".join(banner), end="\n\n")
     
     # --- Step 1: Generate issue URLs ---
     issue_urls = generate_issue_urls(args.journal, args.months)
@@ -1023,49 +1221,59 @@ def main():
     print()
     
     # --- Step 2: Scrape TOC pages ---
-    session = requests.Session()
+    # Pages are fetched concurrently (request starts stay RATE_LIMIT_SECONDS
+    # apart) and reported in order as they arrive. Cached pages skip the
+    # spacing, since they never reach the site.
+    cache_path = None if args.no_cache else output_dir / ".cache" / "pages"
+    session = make_session(cache_path, refresh=args.refresh)
     all_articles = []
-    
-    for i, iu in enumerate(issue_urls):
-        print(f"🔍 [{i+1}/{len(issue_urls)}] Scraping Vol {iu['volume']} Issue {iu['issue']}...")
-        soup = fetch_page(iu["url"], session)
-        if soup:
-            articles = extract_articles_from_toc(soup, iu)
-            all_articles.extend(articles)
-            print(f"   ✓ Found {len(articles)} articles")
-        else:
-            print(f"   ✗ Failed to load page")
-        
-        if i < len(issue_urls) - 1:
-            time.sleep(RATE_LIMIT_SECONDS)
+    spaced_call = spaced(lambda fn, url: fn(url, session), RATE_LIMIT_SECONDS)
+    
+    def polite(fn):
+        """fn(url, session), rate-limited unless the page cache will answer."""
+        def fetch(url):
+            if is_cached(session, url):
+                return fn(url, session)
+            return spaced_call(fn, url)
+        return fetch
+    
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+        soups = pool.map(polite(fetch_page), [iu["url"] for iu in issue_urls])
+        for i, (iu, soup) in enumerate(zip(issue_urls, soups)):
+            print(f"🔍 [{i+1}/{len(issue_urls)}] Scraping Vol {iu['volume']} Issue {iu['issue']}...")
+            if soup:
+                articles = extract_articles_from_toc(soup, iu)
+                all_articles.extend(articles)
+                print(f"   ✓ Found {len(articles)} articles")
+            else:
+                print(f"   ✗ Failed to load page")
     
     print(f"\n📊 Total articles scraped: {len(all_articles)}")
     
-    # --- Step 3: Save raw YAML ---
-    articles_yaml_path = output_dir / "articles_raw.yaml"
-    with open(articles_yaml_path, "w", encoding="utf-8") as f:
-        yaml.dump(all_articles, f, allow_unicode=True, default_flow_style=False, sort_keys=False)
-    print(f"✓ Raw data saved: {articles_yaml_path}")
+    # --- Step 3: Save raw articles_raw data file (optional; Step 9b rewrites it enriched) ---
+    if args.save_raw:
+        write_data(all_articles, articles_path)
+        print(f"✓ Raw data saved: {articles_path}")
     
     # --- Step 4: Handle Editorials ---
     editorials = []
+    # Fix #3: broadened editorial detection (reused by the summary below)
+    editorial_articles = [
+        a for a in all_articles
+        if a.get("article_type", "").lower() in EDITORIAL_TYPES
+    ]
     
     # 4a: Try scraping editorial pages
     if args.scrape_editorials:
-        # Fix #3: broadened editorial detection
-        editorial_articles = [
-            a for a in all_articles
-            if a.get("article_type", "").lower() in EDITORIAL_TYPES
-        ]
         print(f"\n📝 Attempting to scrape {len(editorial_articles)} editorial(s)...")
-        for ea in editorial_articles:
-            print(f"   Fetching: {ea.get('title', 'N/A')}")
-            ed_content = extract_editorial_public(ea["url"], session)
-            if ed_content:
-                ed_content["doi"] = ea.get("doi", "")
-                editorials.append(ed_content)
-                print(f"   ✓ Access: {ed_content.get('access', 'unknown')}")
-            time.sleep(RATE_LIMIT_SECONDS)
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+            contents = pool.map(polite(extract_editorial_public), [ea["url"] for ea in editorial_articles])
+            for ea, ed_content in zip(editorial_articles, contents):
+                print(f"   Fetching: {ea.get('title', 'N/A')}")
+                if ed_content:
+                    ed_content["doi"] = ea.get("doi", "")
+                    editorials.append(ed_content)
+                    print(f"   ✓ Access: {ed_content.get('access', 'unknown')}")
     
     # 4b: Read locally saved editorials
     if args.read_local:
@@ -1075,77 +1283,91 @@ def main():
     
     # Save editorials YAML
     if editorials:
-        ed_yaml_path = output_dir / "editorials.yaml"
-        with open(ed_yaml_path, "w", encoding="utf-8") as f:
-            yaml.dump(editorials, f, allow_unicode=True, default_flow_style=False, sort_keys=False)
+        write_data(editorials, ed_yaml_path)
         print(f"✓ Editorial data saved: {ed_yaml_path}")
     
     # --- Step 5: Relevance scoring ---
     if user_keywords:
         print(f"\n🎯 Computing relevance scores...")
+        norm_kws = [k.lower().strip() for k in user_keywords]
+        matcher = keyword_matcher(norm_kws)
         for a in all_articles:
-            a["relevance_score"] = compute_relevance_score(a, user_keywords)
+            a["relevance_score"] = compute_relevance_score(a, norm_kws, matcher)
         relevant_count = sum(1 for a in all_articles if a["relevance_score"] > 0)
         print(f"   ✓ {relevant_count} articles have relevance > 0")
     
     # --- Step 6: Fetch full abstracts for top relevant ---
     if args.fetch_abstracts > 0 and user_keywords:
-        ranked = sorted(all_articles, key=lambda x: x.get("relevance_score", 0), reverse=True)
-        to_fetch = [a for a in ranked if a.get("relevance_score", 0) > 0][:args.fetch_abstracts]
+        to_fetch = heapq.nlargest(
+            args.fetch_abstracts,
+            (a for a in all_articles if a.get("relevance_score", 0) > 0),
+            key=lambda x: x.get("relevance_score", 0),
+        )
         print(f"\n📖 Fetching full abstracts for top {len(to_fetch)} relevant articles...")
-        for i, a in enumerate(to_fetch):
-            print(f"   [{i+1}/{len(to_fetch)}] {a.get('title', 'N/A')[:60]}...")
-            abstract = fetch_full_abstract(a["url"], session)
-            if abstract:
-                a["full_abstract"] = abstract
-                print(f"   ✓ {len(abstract)} chars")
-            else:
-                print(f"   ✗ Could not fetch")
-            time.sleep(RATE_LIMIT_SECONDS)
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+            abstracts = pool.map(polite(fetch_full_abstract), [a["url"] for a in to_fetch])
+            for i, (a, abstract) in enumerate(zip(to_fetch, abstracts)):
+                print(f"   [{i+1}/{len(to_fetch)}] {a.get('title', 'N/A')[:60]}...")
+                if abstract:
+                    a["full_abstract"] = abstract
+                    print(f"   ✓ {len(abstract)} chars")
+                else:
+                    print(f"   ✗ Could not fetch")
     
     # --- Step 7: Citation context via Semantic Scholar ---
     if args.citation_context:
-        relevant_for_cite = sorted(
-            [a for a in all_articles if a.get("relevance_score", 0) > 0],
-            key=lambda x: x.get("relevance_score", 0), reverse=True
-        )[:15]
+        relevant_for_cite = heapq.nlargest(
+            15,
+            (a for a in all_articles if a.get("relevance_score", 0) > 0),
+            key=lambda x: x.get("relevance_score", 0),
+        )
         if not relevant_for_cite:
             relevant_for_cite = all_articles[:10]
         
         print(f"\n🔗 Querying Semantic Scholar for {len(relevant_for_cite)} articles...")
+        contexts = fetch_citation_contexts([a.get("doi", "") for a in relevant_for_cite], session)
         for i, a in enumerate(relevant_for_cite):
             doi = a.get("doi", "")
             if not doi:
                 continue
             print(f"   [{i+1}/{len(relevant_for_cite)}] {a.get('title', 'N/A')[:50]}...")
-            ctx = fetch_citation_context(doi, session)
+            ctx = contexts.get(doi)
             if ctx:
                 a["citation_count"] = ctx["citation_count"]
                 a["top_references"] = ctx["top_references"]
                 print(f"   ✓ {ctx['citation_count']} citations, {len(ctx['top_references'])} refs")
-            time.sleep(1.0)
     
     # --- Step 7b: Seed-DOI citation network ---
     seed_network = []
     if args.seed_dois:
         seed_dois = [d.strip() for d in args.seed_dois.split(",") if d.strip()]
         print(f"\n📚 Querying Semantic Scholar for {len(seed_dois)} seed/benchmark DOIs...")
+        # Semantic Scholar gets its own, slower limiter than nature.com, and a
+        # 429 pauses it for all workers; a DOI listed twice is only queried once
+        s2_fetch = spaced(
+            lambda doi: fetch_seed_citation_network(doi, session, backoff=s2_fetch.pause),
+            S2_RATE_LIMIT_SECONDS,
+        )
+        unique_dois = list(dict.fromkeys(seed_dois))
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+            networks = dict(zip(unique_dois, pool.map(s2_fetch, unique_dois)))
         for i, doi in enumerate(seed_dois):
             print(f"   [{i+1}/{len(seed_dois)}] {doi}")
-            result = fetch_seed_citation_network(doi, session)
-            if result:
+            result = networks[doi]
+            if result and result.get("rate_limited"):
+                print(f"   ✗ Rate-limited by Semantic Scholar, skipped")
+            elif result:
                 seed_network.append(result)
                 print(f"   ✓ {result['title'][:50]}... ({result['citation_count']} citations)")
             else:
                 print(f"   ✗ Not found")
-            time.sleep(1.5)
     
     # --- Step 7c: Cross-journal keyword search ---
     cross_journal_results = []
     if args.cross_journal and user_keywords:
         cj_journals = [j.strip() for j in args.cross_journal.split(",") if j.strip()]
         print(f"\n🌐 Cross-journal search for your keywords in {cj_journals}...")
-        cross_journal_results = search_nature_keywords(user_keywords, cj_journals, session)
+        cross_journal_results = search_nature_keywords(user_keywords, cj_journals, polite(fetch_page))
         print(f"   ✓ Found {len(cross_journal_results)} articles across journals")
     
     # --- Step 8: Analyze trends ---
@@ -1165,28 +1387,21 @@ def main():
         cross_journal_results=cross_journal_results,
     )
     
-    # --- Step 9b: Save updated YAML with new fields ---
-    articles_yaml_path = output_dir / "articles_raw.yaml"
-    with open(articles_yaml_path, "w", encoding="utf-8") as f:
-        yaml.dump(all_articles, f, allow_unicode=True, default_flow_style=False, sort_keys=False)
-    print(f"✓ Updated data saved: {articles_yaml_path}")
+    # --- Step 9b: Save updated articles_raw data file with new fields ---
+    write_data(all_articles, articles_path)
+    print(f"✓ Updated data saved: {articles_path}")
     
     # --- Summary ---
     print(f"\n{'='*50}")
     print(f"✅ Done! Files saved to: {output_dir}/")
-    print(f"   📄 articles_raw.yaml   — raw metadata ({len(all_articles)} articles)")
+    print(f"   📄 {articles_path.name:<20s}— raw metadata ({len(all_articles)} articles)")
     if editorials:
-        print(f"   📝 editorials.yaml     — editorial content ({len(editorials)} items)")
+        print(f"   📝 {ed_yaml_path.name:<20s}— editorial content ({len(editorials)} items)")
     print(f"   📊 trend_report.md     — trend analysis for /story workflow")
     
     # Check for editorials that need manual download (Fix #3: broadened)
-    ed_types = [
-        a for a in all_articles
-        if a.get("article_type", "").lower() in EDITORIAL_TYPES
-    ]
-    unscraped = [a for a in ed_types if not any(
-        e.get("title") == a.get("title") for e in editorials
-    )]
+    have_titles = {e.get("title") for e in editorials}
+    unscraped = [a for a in editorial_articles if a.get("title") not in have_titles]
     if unscraped:
         print(f"\n⚠  {len(unscraped)} editorial(s) need manual download:")
         for a in unscraped: